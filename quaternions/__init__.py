@@ -0,0 +1,41 @@
+'''
+Quaternion and dual quaternion helper classes.
+
+Submodules are imported on first access, so `import quaternions` is cheap and NumPy and matplotlib are only loaded by the features that need them.
+`quat`, `dual_num` and `dual_quat` need only the standard library, the array, plotting and analysis modules import NumPy, and quat_plot only imports matplotlib on first use of the features which need it.
+
+The classes share the names of their modules, so import them from the submodule, e.g. `from quaternions.quat import quat`.
+'''
+__all__ = [
+    'quat',
+    'dual_num',
+    'dual_quat',
+    'validation',
+    'quat_array',
+    'dual_num_array',
+    'dual_quat_array',
+    'trajectory',
+    'pipeline',
+    'kinematic_chain',
+    'scan',
+    'skinning',
+    'spline',
+    'pose_track',
+    'averaging',
+    'quat_index',
+    'instrument',
+    'quat_plot',
+    ]
+
+# Also importable on access, but left out of star imports as they register matplotlib patches or are scripts
+_SUBMODULES = (*__all__, 'arrow3d', 'benchmark')
+
+def __getattr__(name: str) :
+    if name in _SUBMODULES :
+        import importlib
+        return importlib.import_module(f'.{name}', __name__)
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+def __dir__() :
+    return sorted(set(globals()) | set(_SUBMODULES))
@@ -0,0 +1,120 @@
+from .quat import quat
+from .quat_array import quat_array
+from .dual_quat import dual_quat
+from .dual_quat_array import dual_quat_array
+from . import validation
+import numpy as np
+
+class quat_mean() :
+    def __init__(self) :
+        '''
+        Streaming weighted mean of unit quaternions by the eigenvector method.
+
+        The mean is the eigenvector with the largest eigenvalue of M = sum(w_i q_i q_i^T), which is independent of the order and of the sign of each quaternion.
+        Only the 4x4 matrix M is kept, so sets larger than memory can be averaged by adding them in chunks.
+
+        Markley, Cheng, Crassidis and Oshman, 2007, Averaging quaternions (https://doi.org/10.2514/1.28949)
+        '''
+        self.m = np.zeros((4, 4))
+        self.total = 0.0
+
+    def add(self, qs, weights = None, check: bool = None) :
+        '''
+        Adds a chunk of quaternions to the mean.
+
+        Args
+        ---
+        qs : quat, quat_array, list[quat] or array_like
+            (N, 4) unit quaternions to add
+        weights : array_like, opt.
+            (N,) non negative weight of each quaternion, by default 1
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        self : quat_mean
+        '''
+        qs = quat_array(qs, copy=False)
+        if validation.should_check(check) and not np.all(qs.is_unit()) :
+            raise BaseException('Only unit quaternions are valid representations of rotations')
+
+        weights = _weights(weights, len(qs))
+        self.m += np.einsum('n,ni,nj->ij', weights, qs.q, qs.q)
+        self.total += weights.sum()
+        return self
+
+    def result(self) :
+        '''
+        Returns the mean of the quaternions added so far.
+
+        Returns
+        ---
+        q : quat
+            The unit quaternion mean, with a non negative scalar part
+        '''
+        if self.total <= 0 :
+            raise ValueError('No quaternions with a positive weight have been added')
+
+        _, vecs = np.linalg.eigh(self.m)
+        q = vecs[:, -1]
+        return quat._new(*(q if q[0] >= 0 else -q).tolist())
+
+class dual_quat_mean() :
+    def __init__(self) :
+        '''
+        Streaming weighted mean of unit dual quaternion poses.
+
+        The rotation is the eigenvector mean of the rotations and the translation is the weighted mean of the translations.
+        Only a 4x4 matrix and a running translation sum are kept, so sets larger than memory can be averaged by adding them in chunks.
+        '''
+        self.rot = quat_mean()
+        self.vec = np.zeros(3)
+
+    def add(self, dqs, weights = None, check: bool = None) :
+        '''
+        Adds a chunk of dual quaternions to the mean.
+
+        Args
+        ---
+        dqs : dual_quat, dual_quat_array, list[dual_quat] or array_like
+            (N, 8) unit dual quaternions to add
+        weights : array_like, opt.
+            (N,) non negative weight of each dual quaternion, by default 1
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        self : dual_quat_mean
+        '''
+        vec, rot = dual_quat_array(dqs, copy=False).as_trans(check)
+
+        weights = _weights(weights, vec.shape[0])
+        self.rot.add(rot, weights, validation.nested_check(check))
+        self.vec += weights @ vec
+        return self
+
+    def result(self) :
+        '''
+        Returns the mean of the dual quaternions added so far.
+
+        Returns
+        ---
+        dq : dual_quat
+        '''
+        rot = self.rot.result()
+        return dual_quat.from_trans((self.vec / self.rot.total).tolist(), rot, False)
+
+def _weights(weights, count: int) :
+    '''Returns validated (N,) weights, by default all 1.'''
+    if weights is None :
+        return np.ones(count)
+
+    weights = np.asarray(weights, dtype=np.float64)
+    if weights.shape != (count,) :
+        raise ValueError(f'Expected {count} weights, got shape {weights.shape}')
+    elif np.any(weights < 0) :
+        raise ValueError('Weights must not be negative')
+
+    return weights
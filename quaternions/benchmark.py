@@ -0,0 +1,332 @@
+from .quat import quat
+from .dual_quat import dual_quat
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+import numpy as np
+
+# Benchmark cases, each maps a size to a function performing the work being measured
+CASES = {}
+
+# Modules whose import is timed, each in a fresh interpreter
+IMPORTS = ['quaternions', 'quaternions.quat', 'quaternions.dual_quat', 'quaternions.quat_array', 'quaternions.quat_plot']
+
+# Dependencies reported when importing a module loads them
+HEAVY = ('numpy', 'matplotlib')
+
+def case(name: str) :
+    '''Registers a benchmark case under a name.'''
+    def register(setup) :
+        CASES[name] = setup
+        return setup
+    return register
+
+def _rand_quats(n: int, seed: int = 0) :
+    '''Returns n random unit quaternions, the same for every run.'''
+    rng = np.random.default_rng(seed)
+    return [quat(list(q)).normalized() for q in rng.normal(size=(n, 4))]
+
+def _rand_dual_quats(n: int, seed: int = 0) :
+    '''Returns n random unit dual quaternions, the same for every run.'''
+    rng = np.random.default_rng(seed)
+    return [dual_quat.from_trans(list(vec), q) for vec, q in zip(rng.normal(size=(n, 3)), _rand_quats(n, seed + 1))]
+
+@case('quat.__mul__')
+def _quat_mul(n: int) :
+    a, b = _rand_quats(n), _rand_quats(n, 1)
+    return lambda : [p * q for p, q in zip(a, b)]
+
+@case('quat.normalized')
+def _quat_normalized(n: int) :
+    qs = [2 * q for q in _rand_quats(n)]
+    return lambda : [q.normalized() for q in qs]
+
+@case('quat.rot_apply')
+def _quat_rot_apply(n: int) :
+    qs = _rand_quats(n)
+    return lambda : [q.rot_apply([1, 2, 3]) for q in qs]
+
+@case('quat.rot_apply_many')
+def _quat_rot_apply_many(n: int) :
+    q = _rand_quats(1)[0]
+    points = np.random.default_rng(0).normal(size=(n, 3))
+    return lambda : q.rot_apply_many(points)
+
+@case('quat.slerp_n')
+def _quat_slerp_n(n: int) :
+    a, b = _rand_quats(2)
+    return lambda : a.slerp_n(b, n)
+
+@case('quat.qlerp_n')
+def _quat_qlerp_n(n: int) :
+    a, b = _rand_quats(2)
+    return lambda : a.qlerp_n(b, n)
+
+@case('dual_quat.__mul__')
+def _dual_quat_mul(n: int) :
+    a, b = _rand_dual_quats(n), _rand_dual_quats(n, 2)
+    return lambda : [p * q for p, q in zip(a, b)]
+
+@case('dual_quat.as_trans')
+def _dual_quat_as_trans(n: int) :
+    dqs = _rand_dual_quats(n)
+    return lambda : [dq.as_trans() for dq in dqs]
+
+@case('dual_quat.as_screw')
+def _dual_quat_as_screw(n: int) :
+    dqs = _rand_dual_quats(n)
+    return lambda : [dq.as_screw() for dq in dqs]
+
+@case('dual_quat.transform_points')
+def _dual_quat_transform_points(n: int) :
+    dq = _rand_dual_quats(1)[0]
+    points = np.random.default_rng(0).normal(size=(n, 3))
+    return lambda : dq.transform_points(points)
+
+@case('dual_quat.sclerp_n')
+def _dual_quat_sclerp_n(n: int) :
+    a, b = _rand_dual_quats(2)
+    return lambda : a.sclerp_n(b, n)
+
+@case('dual_quat.lerp_n')
+def _dual_quat_lerp_n(n: int) :
+    a, b = _rand_dual_quats(2)
+    return lambda : a.lerp_n(b, n)
+
+@case('quat_plot.plot_quats')
+def _plot_quats(n: int) :
+    return _plot_case('plot_quats', _rand_quats(n))
+
+@case('quat_plot.plot_dual_quats')
+def _plot_dual_quats(n: int) :
+    return _plot_case('plot_dual_quats', _rand_dual_quats(n))
+
+def _plot_case(name: str, poses: list) :
+    '''Returns a function plotting the poses onto a fresh 3D axis, or None if matplotlib is not installed.'''
+    try :
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        from . import quat_plot
+    except ImportError :
+        return None
+
+    plot = getattr(quat_plot, name)
+
+    def run() :
+        fig = plt.figure()
+        ax = fig.add_subplot(111, projection='3d')
+        plot(ax, poses, 'basis')
+        fig.canvas.draw()
+        plt.close(fig)
+
+    return run
+
+def measure(func, repeat: int) :
+    '''
+    Times a function and measures its peak memory.
+
+    Args
+    ---
+    func : callable
+        The function to measure, called with no arguments
+    repeat : int
+        Number of timed calls
+
+    Returns
+    ---
+    result : dict
+        The best and median times in seconds, and the peak memory allocated in bytes
+    '''
+    # Warm up caches and lazy imports before timing
+    func()
+
+    times = []
+    for _ in range(repeat) :
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    # Tracing slows allocations down, so memory is measured in a separate call
+    tracemalloc.start()
+    try :
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally :
+        tracemalloc.stop()
+
+    return {'best': min(times), 'median': statistics.median(times), 'peak_bytes': peak}
+
+def measure_import(module: str, repeat: int) :
+    '''
+    Times importing a module in fresh interpreters and finds which heavy dependencies it loads.
+
+    Args
+    ---
+    module : str
+        The module to import
+    repeat : int
+        Number of timed imports
+
+    Returns
+    ---
+    result : dict
+        The best and median times in seconds, and the heavy dependencies loaded by the import
+    '''
+    # The first import compiles the package, so the timed imports read cached bytecode as an installed package would
+    env = {key: value for key, value in os.environ.items() if key != 'PYTHONDONTWRITEBYTECODE'}
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [os.path.dirname(os.path.dirname(os.path.abspath(__file__))), env.get('PYTHONPATH')]))
+
+    times = []
+    for _ in range(repeat + 1) :
+        proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'], env=env, capture_output=True, text=True, check=True)
+
+        # Each line is 'import time: self [us] | cumulative | name', indented by nesting depth
+        loaded = {}
+        for line in proc.stderr.splitlines() :
+            fields = line.split('|')
+            if len(fields) == 3 and fields[1].strip().isdigit() :
+                loaded[fields[2].strip()] = int(fields[1]) * 1e-6
+        times.append(loaded[module])
+
+    loads = sorted({name.split('.')[0] for name in loaded} & set(HEAVY))
+    return {'best': min(times[1:]), 'median': statistics.median(times[1:]), 'loads': loads}
+
+def run(sizes: list[int], repeat: int, names: list[str] = None) :
+    '''
+    Runs the benchmark cases at each size.
+
+    Args
+    ---
+    sizes : list[int]
+        Input sizes to run each case at
+    repeat : int
+        Number of timed calls of each case
+    names : list[str], opt.
+        Substrings selecting the cases to run, by default all cases
+
+    Returns
+    ---
+    report : dict
+        The environment and the results keyed by 'case[size]', or 'import module' for the import timings
+    '''
+    results = {}
+    for name, setup in CASES.items() :
+        if names and not any(sub in name for sub in names) :
+            continue
+
+        for n in sizes :
+            func = setup(n)
+            if func is None :
+                print(f'{name}[{n}]: skipped')
+                continue
+
+            key = f'{name}[{n}]'
+            results[key] = measure(func, repeat)
+            print(f'{key}: {_format_time(results[key]["best"])}, peak {_format_bytes(results[key]["peak_bytes"])}')
+
+    for module in IMPORTS :
+        key = f'import {module}'
+        if names and not any(sub in key for sub in names) :
+            continue
+
+        results[key] = measure_import(module, repeat)
+        print(f'{key}: {_format_time(results[key]["best"])}, loads {", ".join(results[key]["loads"]) or "no heavy dependencies"}')
+
+    env = {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'repeat': repeat
+    }
+    return {'environment': env, 'results': results}
+
+def compare(report: dict, baseline: dict, threshold: float) :
+    '''
+    Compares results against a baseline, printing the change of each case.
+
+    Args
+    ---
+    report : dict
+        The report from run
+    baseline : dict
+        A previous report to compare against
+    threshold : float
+        Fractional increase in the best time or peak memory which is flagged as a regression
+
+    Returns
+    ---
+    regressions : list[str]
+        The cases which regressed
+    '''
+    regressions = []
+    for key, result in report['results'].items() :
+        base = baseline['results'].get(key)
+        if base is None :
+            continue
+
+        time_ratio = result['best'] / base['best'] if base['best'] > 0 else 1
+        # Import timings have no memory measurement
+        mem_ratio = result['peak_bytes'] / base['peak_bytes'] if base.get('peak_bytes', 0) > 0 else 1
+
+        flag = ''
+        if time_ratio > 1 + threshold or mem_ratio > 1 + threshold :
+            regressions.append(key)
+            flag = '  REGRESSION'
+
+        print(f'{key}: time x{time_ratio:.2f}, memory x{mem_ratio:.2f}{flag}')
+
+    if baseline.get('environment') != report['environment'] :
+        print('Warning: the baseline was recorded in a different environment')
+
+    return regressions
+
+def _format_time(seconds: float) :
+    '''Formats a duration with a readable unit.'''
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)) :
+        if seconds >= scale :
+            return f'{seconds / scale:.3f} {unit}'
+    return f'{seconds / 1e-9:.0f} ns'
+
+def _format_bytes(size: int) :
+    '''Formats a number of bytes with a readable unit.'''
+    for unit, scale in (('MiB', 2 ** 20), ('KiB', 2 ** 10)) :
+        if size >= scale :
+            return f'{size / scale:.1f} {unit}'
+    return f'{size} B'
+
+def main(argv: list[str] = None) :
+    parser = argparse.ArgumentParser(description='Times the scalar and batched hot paths of the library and their peak memory, and the import time of its modules.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000], help='input sizes to run each case at')
+    parser.add_argument('--repeat', type=int, default=5, help='number of timed calls of each case')
+    parser.add_argument('--cases', nargs='+', help='substrings selecting the cases to run')
+    parser.add_argument('--output', default='benchmark_results.json', help='file to write the results to')
+    parser.add_argument('--baseline', help='results file to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2, help='fractional slowdown or memory increase flagged as a regression')
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes, args.repeat, args.cases)
+
+    with open(args.output, 'w') as file :
+        json.dump(report, file, indent=2)
+
+    if args.baseline :
+        with open(args.baseline) as file :
+            baseline = json.load(file)
+
+        regressions = compare(report, baseline, args.threshold)
+        if regressions :
+            print(f'{len(regressions)} regressions beyond {args.threshold:.0%}')
+            return 1
+
+    return 0
+
+if __name__ == '__main__' :
+    sys.exit(main())
@@ -1,7 +1,8 @@
-from typing import Self
 import math
 
 class dual_num() :
+    __slots__ = ('r', 'd')
+
     def __init__(self, real, dual) :
         self.r = real
         self.d = dual
@@ -25,5 +26,14 @@ class dual_num() :
         else :
             return dual_num(self.r / p, self.d / p)
 
+    def __eq__(self, p) :
+        if type(p) == dual_num :
+            return (self.r, self.d) == (p.r, p.d)
+        else :
+            return NotImplemented
+
+    def __hash__(self) :
+        return hash((self.r, self.d))
+
     def __str__(self) :
         return f'r: {self.r}, d: {self.d}'
\ No newline at end of file
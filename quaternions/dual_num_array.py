@@ -0,0 +1,53 @@
+from .dual_num import dual_num
+import numpy as np
+
+class dual_num_array() :
+    # Defer arithmetic with ndarrays to the reflected operators below
+    __array_ufunc__ = None
+
+    def __init__(self, real, dual) :
+        '''
+        Construct an array of dual numbers.
+
+        Args
+        ---
+        real : array_like
+            (N,) real components
+        dual : array_like
+            (N,) dual components
+        '''
+        self.r = np.asarray(real, dtype=np.float64)
+        self.d = np.asarray(dual, dtype=np.float64)
+
+    def sqrt(self) :
+        '''Returns the posative dual number square roots if they all exist.'''
+        if np.any(self.r < 0) or np.any((self.r == 0) & (self.d != 0)) :
+            raise ArithmeticError(f'Dual number square root does not exist for {self}')
+
+        r = np.sqrt(self.r)
+        safe = np.where(r > 0, r, 1)
+        return dual_num_array(r, np.where(r > 0, self.d / (2 * safe), 0))
+
+    def __truediv__(self, p) :
+        '''Scalar or dual number division.'''
+        if isinstance(p, (dual_num, dual_num_array)) :
+            return dual_num_array(self.r / p.r, (p.r * self.d - p.d * self.r) / p.r ** 2)
+
+        else :
+            return dual_num_array(self.r / p, self.d / p)
+
+    def __len__(self) :
+        return self.r.shape[0]
+
+    def __getitem__(self, idx) :
+        '''Returns a dual_num for an integer index, otherwise a dual_num_array.'''
+        if isinstance(idx, (int, np.integer)) :
+            return dual_num(float(self.r[idx]), float(self.d[idx]))
+        return dual_num_array(self.r[idx], self.d[idx])
+
+    def __iter__(self) :
+        for r, d in zip(self.r.tolist(), self.d.tolist()) :
+            yield dual_num(r, d)
+
+    def __str__(self) :
+        return f'r: {self.r}, d: {self.d}'
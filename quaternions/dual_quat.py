@@ -0,0 +1,751 @@
+from __future__ import annotations
+from .quat import quat, _scalar, _sinc
+from .dual_num import dual_num
+from . import validation
+import math
+
+TYPE_CHECKING = False
+if TYPE_CHECKING :
+    from typing import Self
+
+_alloc = object.__new__
+
+class dual_quat() :
+    __slots__ = ('r', 'd')
+
+    def __init__(self, real = [1, 0, 0, 0], dual = [1, 0, 0, 0]) :
+        '''
+        Constructs a generic dual quaternion.
+
+        Args
+        ---
+        real : array_like or quat, opt.
+            Real component of the dual quaternion
+        dual : array_like or quat, opt.
+            Real component of the dual quaternion
+        '''
+        if type(real) == quat :
+            self.r = real
+        else :
+            self.r = quat(real)
+
+        if type(dual) == quat :
+            self.d = dual
+        else :
+            self.d = quat(dual)
+
+    def _new(real: quat, dual: quat) :
+        '''
+        Constructs a dual quaternion directly from its real and dual quaternions.
+
+        Used internally by arithmetic to skip the type checks in __init__.
+        '''
+        dq = _alloc(dual_quat)
+        dq.r = real
+        dq.d = dual
+        return dq
+        
+    def from_trans(translation, rotation, check: bool = None) :
+        '''
+        Constructs a dual quaternion representing transformation of a translation followed by a rotation.
+
+        dual_quat = rotation + epsilon * (1/2 translation * rotation)
+        
+        Args
+        ---
+        translation : quat or array_like
+            Translation provided either as a pure quaternion or an R^3 translation vector
+        rotation : quat or array_like
+            Rotation provided as a unit quaternion
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+        '''
+        if type(translation) == quat :
+            qt = translation
+        elif len(translation) == 3 :
+            qt = quat([0, translation[0], translation[1], translation[2]])
+        elif len(translation) == 4 :
+            qt = quat(translation)
+
+        if not qt.is_pure() :
+            raise BaseException(f'Translation {qt} must be a pure quaternion')
+
+        if type(rotation) == quat :
+            if not validation.should_check(check) or rotation.is_unit() :
+                qr = rotation.copy()
+            else :
+                raise BaseException(f'Rotation {rotation} must be a unit quaternion')
+        else :
+            qr = quat(rotation)
+
+        return dual_quat._new(qr, 0.5 * qt * qr)
+    
+    def as_trans(self, check: bool = None) :
+        '''
+        Returns the transformation and rotation defined by a unit dual quaternion.
+
+        dq = A + eB
+
+        Args
+        ---
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        translation : list
+            Translation vector 2 * B * A^-1
+        rotation : quat
+            Rotation quaternion A
+        '''
+        if not validation.should_check(check) or self.is_unit() :
+            vec = 2 * self.d * self.r.conj()
+            return [vec.x, vec.y, vec.z], self.r.copy()
+        else :
+            raise BaseException('Only unit dual quaternions are valid representations of 3D transforms')
+
+    def transform_points(self, points, out = None, check: bool = None) :
+        '''
+        Applies the transform defined by a unit dual quaternion to many points at once.
+
+        The rotation is converted to a 3x3 matrix once and applied with a single matrix multiply before the translation is added.
+
+        Args
+        ---
+        points : array_like
+            (N, 3) points in R^3 to transform
+        out : ndarray, opt.
+            (N, 3) float64 array to write the transformed points into, may be points itself
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        points_trans : ndarray
+            (N, 3) transformed points
+        '''
+        vec, rot = self.as_trans(check)
+
+        out = rot.rot_apply_many(points, out, validation.nested_check(check))
+        out += vec
+
+        return out
+
+    def as_matrix(self, check: bool = None) :
+        '''
+        Returns the 4x4 homogeneous transformation matrix represented by a unit dual quaternion.
+
+        Args
+        ---
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        mat : ndarray
+            (4, 4) homogeneous transformation matrix
+        '''
+        import numpy as np
+
+        vec, rot = self.as_trans(check)
+
+        mat = np.eye(4)
+        mat[:3, :3] = rot.as_matrix(False)
+        mat[:3, 3] = vec
+        return mat
+
+    def from_matrix(mat) :
+        '''
+        Constructs a unit dual quaternion from a 4x4 homogeneous transformation matrix.
+
+        Args
+        ---
+        mat : array_like
+            (4, 4) homogeneous transformation matrix
+        '''
+        import numpy as np
+
+        mat = np.asarray(mat, dtype=np.float64)
+        return dual_quat.from_trans(mat[:3, 3].tolist(), quat.from_matrix(mat[:3, :3]), False)
+
+    def from_screw(u: list[float], m: list[float], theta: float, d: float) :
+        '''
+        Constructs a unit dual quaternion from the screw parameters of a transform.
+
+        Args
+        ---
+        u : list[float]
+            Unit vector representing the screw axis
+        m : list[float]
+            Moment vector
+        theta : float
+            Rotation angle
+        d : float
+            Displacement distance
+        '''
+        theta = theta / 2
+        cos = math.cos(theta)
+        sin = math.sin(theta)
+        coef = d / 2
+
+        return dual_quat._new(quat._new(cos, u[0] * sin, u[1] * sin, u[2] * sin),
+                              quat._new(-coef * sin,
+                                        coef * u[0] * cos + sin * m[0],
+                                        coef * u[1] * cos + sin * m[1],
+                                        coef * u[2] * cos + sin * m[2]))
+
+    def as_screw(self, check: bool = None) :
+        '''
+        Returns the screw parameters of a unit dual quaternion.
+
+        Args
+        ---
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        u : list[float]
+            Unit vector representing the screw axis
+        m : list[float]
+            Moment vector
+        theta : float
+            Rotation angle
+        d : float
+            Displacement distance
+        '''
+        if validation.should_check(check) and not self.is_unit() :
+            raise BaseException('Only unit dual quaternions are valid representations of 3D transforms')
+        
+        check = validation.nested_check(check)
+        theta, u = self.r.as_axis(check)
+        vec, _ = self.as_trans(check)
+        
+        d = vec[0]*u[0] + vec[1]*u[1] + vec[2]*u[2]
+        if not theta == 0 and not theta == 2 * math.pi :
+            cotan = 1 / math.tan(theta / 2)
+        else :
+            raise ZeroDivisionError
+        
+        m = [
+            0.5 * (vec[1]*u[2] - vec[2]*u[1] + (vec[0] - d * u[0]) * cotan),
+            0.5 * (vec[2]*u[0] - vec[0]*u[2] + (vec[1] - d * u[1]) * cotan),
+            0.5 * (vec[0]*u[1] - vec[1]*u[0] + (vec[2] - d * u[2]) * cotan)
+        ]
+    
+        return u, m, theta, d
+        
+    def exp(self) :
+        '''
+        Returns the dual quaternion exponential.
+
+        exp(A + eB) = exp(A) + e D exp(A)[B], the dual part being the derivative of the quaternion exponential at A along B.
+
+        The exponential of a pure dual quaternion (0, theta/2 u) + e(0, d/2 u + theta/2 m) is the unit dual quaternion of the screw (u, m, theta, d).
+        '''
+        r, d = self.r, self.d
+        ax, ay, az = r.x, r.y, r.z
+        bx, by, bz = d.x, d.y, d.z
+
+        phi_sq = ax * ax + ay * ay + az * az
+        phi = math.sqrt(phi_sq)
+        dot = ax * bx + ay * by + az * bz
+
+        scale = math.exp(r.w)
+        cos = math.cos(phi)
+        sinc = _sinc(phi)
+
+        # Derivative of sinc(phi) / phi, using its Taylor series near 0
+        if phi < 1e-4 :
+            coef = -1 / 3 + phi_sq / 30
+        else :
+            coef = (cos - sinc) / phi_sq
+
+        real = scale * sinc
+        dual = scale * (d.w * sinc + coef * dot)
+        return dual_quat._new(quat._new(scale * cos, real * ax, real * ay, real * az),
+                              quat._new(scale * (d.w * cos - sinc * dot),
+                                        dual * ax + real * bx,
+                                        dual * ay + real * by,
+                                        dual * az + real * bz))
+
+    def log(self, check: bool = None) :
+        '''
+        Returns the logarithm of a unit dual quaternion, the inverse of exp.
+
+        The logarithm is the pure dual quaternion (0, theta/2 u) + e(0, d/2 u + theta/2 m) of the screw (u, m, theta, d), which is defined for pure translations too.
+
+        Args
+        ---
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        log : dual_quat
+        '''
+        if validation.should_check(check) and not self.is_unit() :
+            raise BaseException('Only unit dual quaternions are valid representations of 3D transforms')
+
+        r, d = self.r, self.d
+        a = r.log()
+        ax, ay, az = a.x, a.y, a.z
+
+        # Half the translation, the vector part of B A*
+        hx = r.w * d.x - d.w * r.x + r.y * d.z - r.z * d.y
+        hy = r.w * d.y - d.w * r.y + r.z * d.x - r.x * d.z
+        hz = r.w * d.z - d.w * r.z + r.x * d.y - r.y * d.x
+
+        # (1 - phi cot(phi)) / phi^2, using its Taylor series near 0
+        phi_sq = ax * ax + ay * ay + az * az
+        phi = math.sqrt(phi_sq)
+        if phi < 1e-4 :
+            coef = 1 / 3 + phi_sq / 45
+        elif math.pi - phi < 1e-8 :
+            # A whole turn is no rotation, so the screw is along the translation with no moment, any other axis would need an infinite moment
+            h_norm = math.sqrt(hx * hx + hy * hy + hz * hz)
+            if h_norm > 0 :
+                ax, ay, az = phi * hx / h_norm, phi * hy / h_norm, phi * hz / h_norm
+            coef = 0.0
+        else :
+            coef = (1 - phi * math.cos(phi) / math.sin(phi)) / phi_sq
+
+        # B = h - a x h + coef a x (a x h)
+        cx = ay * hz - az * hy
+        cy = az * hx - ax * hz
+        cz = ax * hy - ay * hx
+        return dual_quat._new(quat._new(0.0, ax, ay, az),
+                              quat._new(0.0,
+                                        hx - cx + coef * (ay * cz - az * cy),
+                                        hy - cy + coef * (az * cx - ax * cz),
+                                        hz - cz + coef * (ax * cy - ay * cx)))
+
+    def integrate(self, omega: list[float], v: list[float], dt: float) :
+        '''
+        Integrates a constant twist over a time step, exactly rather than by Euler steps.
+
+        dq(t + dt) = dq(t) exp((omega + e v) dt / 2)
+
+        Args
+        ---
+        omega : list[float]
+            Angular velocity in radians per unit time, in the frame of the transform
+        v : list[float]
+            Linear velocity, in the frame of the transform
+        dt : float
+            The time step
+
+        Returns
+        ---
+        dq : dual_quat
+            The transform after the time step
+        '''
+        half = dt / 2
+        step = dual_quat._new(quat._new(0.0, omega[0] * half, omega[1] * half, omega[2] * half),
+                              quat._new(0.0, v[0] * half, v[1] * half, v[2] * half))
+        return self * step.exp()
+
+    def sclerp(self, stop: Self, tau: float, check: bool = None) :
+        '''
+        Perform Screw Linear Interpolation (SCLERP) from the current unit dual quaternion to another.
+
+        Args
+        ---
+        stop : dual_quat
+            The unit dual quaternion to perform interpolation to from this one
+        tau : float
+            A value between 0 and 1 representing how far along the interpolation to retrun a value for
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        dq : dual_quat
+            A dual quaternion interpolated between self and stop
+        '''
+        return self.sclerp_plan(stop, check)(tau)
+
+    def sclerp_plan(self, stop: Self, check: bool = None) :
+        '''
+        Precomputes a Screw Linear Interpolation (SCLERP) from the current unit dual quaternion to another.
+
+        The logarithm of the relative transform is computed once, so the returned interpolator can be evaluated at any number of values of tau cheaply.
+
+        Args
+        ---
+        stop : dual_quat
+            The unit dual quaternion to perform interpolation to from this one
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        interp : screw_interp
+            Interpolator evaluated by calling it with a float or an array of values of tau
+        '''
+        return screw_interp(self, stop, check)
+
+    def sclerp_n(self, stop: Self, n: int, check: bool = None) :
+        '''
+        Returns n equally spaced dual quaternions interpolated between self and stop.
+
+        Args
+        ---
+        stop : quat
+            Unit dual quaternion to interpolate to
+        n : int
+            Number of interpolated dual quaternions to return
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        dqs : list[dual_quat]
+            Use sclerp_plan(stop).sample_n(n) for the samples as a dual_quat_array
+        '''
+        return list(self.sclerp_plan(stop, check).sample_n(n))
+    
+    def lerp(self, stop: Self, tau: float, check: bool = None) :
+        '''
+        Perform linear interpolation from the current unit dual quaternion to another using SLERP for the rotaion.
+
+        Args
+        ---
+        stop : dual_quat
+            The unit dual quaternion to perform interpolation to from this one
+        tau : float
+            A value between 0 and 1 representing how far along the interpolation to retrun a value for
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        dq : dual_quat
+            A dual quaternion interpolated between self and stop
+        '''
+        if validation.should_check(check) and not (self.is_unit() and stop.is_unit()) :
+            raise BaseException('Only unit dual quaternions are valid representations of 3D transforms')
+        elif not (tau >= 0 and tau <= 1) :
+            raise BaseException(f'The value of tau {tau} must be in [0,1]')
+        
+        check = validation.nested_check(check)
+        start = self
+        rot = start.r.slerp(stop.r, tau, check)
+        
+        start_vec, _ = start.as_trans(check)
+        stop_vec, _ = stop.as_trans(check)
+        lin_interp = [a + tau * (b - a) for a, b in zip(start_vec, stop_vec)]
+        
+        return dual_quat.from_trans(lin_interp, rot, check)
+    
+    def lerp_n(self, stop: Self, n: int, check: bool = None) :
+        '''
+        Returns n equally spaced dual quaternions interpolated between self and stop using SLERP for the rotation.
+
+        Args
+        ---
+        stop : quat
+            Unit dual quaternion to interpolate to
+        n : int
+            Number of interpolated dual quaternions to return
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        dqs : list[dual_quat]
+        '''
+        if n > 0 :
+            d_tau = 1 / (n + 1)
+        else :
+            raise ZeroDivisionError
+
+        if validation.should_check(check) and not (self.is_unit() and stop.is_unit()) :
+            raise BaseException('Only unit dual quaternions are valid representations of 3D transforms')
+
+        check = validation.nested_check(check)
+        dqs = []
+        for i in range(n) :
+            dqs.append(self.lerp(stop, (i + 1) * d_tau, check))
+
+        return dqs
+    
+    def q_conj(self) :
+        '''
+        Returns the quaternion conjugate of the dual quaternion.
+        
+        dq = A + eB -> dq* = A* + eB*'''
+        return dual_quat._new(self.r.conj(), self.d.conj())
+    
+    def d_conj(self) :
+        '''
+        Returns the dual number conjugate of the dual quaternion.
+
+        dq = A + eB -> bar{dq} = A - eB
+        '''
+        return dual_quat._new(self.r.copy(), -1 * self.d)
+    
+    def t_conj(self) :
+        '''
+        Returns the total conjugate of the dual quaternion.
+
+        dq = A + eB -> bar{dq*} = A* - eB*
+        '''
+        return self.q_conj().d_conj()
+    
+    def inv(self) :
+        '''Returns the dual quaternion inverse.'''
+        r_conj = self.r.conj()
+        return dual_quat._new(r_conj, -1 * r_conj * self.d * r_conj)
+    
+    def norm(self) :
+        '''Returns the 2 norm of the dual quaternion.'''
+        norm = self * self.q_conj()
+
+        return dual_num(norm.r.w, norm.d.w).sqrt()
+    
+    def normalized(self) :
+        '''
+        Returns the normalized dual quaternion.
+
+        dq = A + eB -> dq / ||dq|| = A / |A| + e (B - A' <A', B>) / |A|, with A' = A / |A|
+        '''
+        norm = self.r.norm()
+        r = self.r / norm
+
+        return dual_quat._new(r, (self.d + -r.sum_sq(self.d) * r) / norm)
+
+    def normalize_(self) :
+        '''
+        Normalizes the dual quaternion in place and returns it.
+
+        The component quaternions are updated in place, so they should not be shared with other objects.
+        '''
+        r, d = self.r, self.d
+        norm = r.norm()
+        r /= norm
+
+        dot = r.sum_sq(d)
+        d.w = (d.w - dot * r.w) / norm
+        d.x = (d.x - dot * r.x) / norm
+        d.y = (d.y - dot * r.y) / norm
+        d.z = (d.z - dot * r.z) / norm
+        return self
+
+    def is_unit(self) :
+        return True if self.r.is_unit() and self.r.is_orth(self.d) else False
+
+    def __add__(self, p: Self) :
+        '''Dual quaternion addition.'''
+        if not isinstance(p, dual_quat) :
+            return NotImplemented
+
+        return dual_quat._new(self.r + p.r, self.d + p.d)
+    
+    def __mul__(self, p: Self) :
+        '''Dual quaternion multiplication on the right, or multiplication by a real scalar.
+        
+        dq2 = self.r * p.r + e * (self.r * p.d + self.d * p.r)
+        '''
+        if _scalar(p) :
+            return dual_quat.__rmul__(self, p)
+        elif not isinstance(p, dual_quat) :
+            return NotImplemented
+
+        r, pr = self.r, p.r
+        return dual_quat._new(r * pr, (r * p.d) + (self.d * pr))
+    
+    def mul_into(a: Self, b: Self, out: Self) :
+        '''
+        Dual quaternion multiplication a * b written into an existing dual quaternion without allocating a new one.
+
+        dq2 = a.r * b.r + e * (a.r * b.d + a.d * b.r)
+
+        The component quaternions of out are updated in place, so they should not be shared with other objects.
+
+        Args
+        ---
+        a : dual_quat
+            Left side dual quaternion
+        b : dual_quat
+            Right side dual quaternion
+        out : dual_quat
+            The dual quaternion to overwrite with the product, may be a or b
+
+        Returns
+        ---
+        out : dual_quat
+        '''
+        ar, ad, br, bd = a.r, a.d, b.r, b.d
+        aw, ax, ay, az = ar.w, ar.x, ar.y, ar.z
+        ew, ex, ey, ez = ad.w, ad.x, ad.y, ad.z
+        bw, bx, by, bz = br.w, br.x, br.y, br.z
+        fw, fx, fy, fz = bd.w, bd.x, bd.y, bd.z
+
+        r, d = out.r, out.d
+        r.w = aw * bw - ax * bx - ay * by - az * bz
+        r.x = aw * bx + ax * bw + ay * bz - az * by
+        r.y = aw * by - ax * bz + ay * bw + az * bx
+        r.z = aw * bz + ax * by - ay * bx + az * bw
+
+        d.w = aw * fw - ax * fx - ay * fy - az * fz + ew * bw - ex * bx - ey * by - ez * bz
+        d.x = aw * fx + ax * fw + ay * fz - az * fy + ew * bx + ex * bw + ey * bz - ez * by
+        d.y = aw * fy - ax * fz + ay * fw + az * fx + ew * by - ex * bz + ey * bw + ez * bx
+        d.z = aw * fz + ax * fy - ay * fx + az * fw + ew * bz + ex * by - ey * bx + ez * bw
+        return out
+    
+    def __rmul__(self, p) :
+        '''Scalar multiplication.'''
+        if not _scalar(p) :
+            return NotImplemented
+
+        p = float(p)
+        return dual_quat._new(p * self.r, p * self.d)
+    
+    def __truediv__(self, p) :
+        '''Scalar division.'''
+        if not _scalar(p) :
+            return NotImplemented
+
+        p = float(p)
+        return dual_quat._new(self.r / p, self.d / p)
+
+    def __imul__(self, p) :
+        '''
+        In place dual quaternion multiplication self * p, or multiplication by a scalar.
+
+        The component quaternions are updated in place, so they should not be shared with other objects.
+        '''
+        if isinstance(p, dual_quat) :
+            return dual_quat.mul_into(self, p, self)
+        elif not _scalar(p) :
+            return NotImplemented
+
+        p = float(p)
+        self.r *= p
+        self.d *= p
+        return self
+
+    def __iadd__(self, p: Self) :
+        '''In place dual quaternion addition.'''
+        if not isinstance(p, dual_quat) :
+            return NotImplemented
+
+        self.r += p.r
+        self.d += p.d
+        return self
+
+    def __itruediv__(self, p) :
+        '''In place scalar division.'''
+        if not _scalar(p) :
+            return NotImplemented
+
+        p = float(p)
+        self.r /= p
+        self.d /= p
+        return self
+    
+    def __eq__(self, p) :
+        if type(p) == dual_quat :
+            return self.r == p.r and self.d == p.d
+        else :
+            return NotImplemented
+
+    def __hash__(self) :
+        '''
+        Hash of the components, so dual quaternions may be used as dict keys.
+
+        Dual quaternions used as keys must not be modified afterwards.
+        '''
+        return hash((self.r, self.d))
+
+    def __pow__(self, p) :
+        '''Unit dual quaternion raised to the power p, exp(p log(dq)).'''
+        log = self.log()
+        return dual_quat._new(p * log.r, p * log.d).exp()
+
+    def __str__(self) :
+        return f'r: ({self.r}); d: ({self.d})'
+
+class screw_interp() :
+    def __init__(self, start: dual_quat, stop: dual_quat, check: bool = None) :
+        '''
+        Screw Linear Interpolation (SCLERP) between two unit dual quaternions with the logarithm of the relative transform precomputed.
+
+        start (start^-1 stop)^tau = start exp(tau log(start^-1 stop))
+
+        Args
+        ---
+        start : dual_quat
+            The unit dual quaternion to perform interpolation from
+        stop : dual_quat
+            The unit dual quaternion to perform interpolation to
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+        '''
+        if validation.should_check(check) and not (start.is_unit() and stop.is_unit()) :
+            raise BaseException('Only unit dual quaternions are valid representations of 3D transforms')
+
+        # The endpoints were validated here, so evaluations only recheck under the strict policy
+        self.check = validation.nested_check(check)
+
+        if start.r.sum_sq(stop.r) < 0 :
+            start = -1 * start
+
+        self.start = start
+
+        # The logarithm is defined without a relative rotation too, so pure translations need no special case
+        self.log = (start.inv() * stop).log(self.check)
+
+    def __call__(self, tau) :
+        '''
+        Evaluates the interpolation.
+
+        Args
+        ---
+        tau : float or array_like
+            Value or values between 0 and 1 representing how far along the interpolation to return values for
+
+        Returns
+        ---
+        dq : dual_quat or dual_quat_array
+            A dual quaternion interpolated between start and stop for a float tau, otherwise a dual_quat_array
+        '''
+        # NumPy scalars and 0-d arrays have ndim 0, checked without importing NumPy for plain floats
+        if isinstance(tau, (int, float)) or getattr(tau, 'ndim', None) == 0 :
+            tau = float(tau)
+            if not (tau >= 0 and tau <= 1) :
+                raise BaseException(f'The value of tau {tau} must be in [0,1]')
+
+            return self.start * dual_quat._new(tau * self.log.r, tau * self.log.d).exp()
+
+        from .dual_quat_array import dual_quat_array
+        import numpy as np
+
+        tau = np.asarray(tau, dtype=np.float64)
+        if not np.all((tau >= 0) & (tau <= 1)) :
+            raise BaseException(f'The values of tau {tau} must be in [0,1]')
+
+        return self.start * dual_quat_array(np.multiply.outer(tau, dual_quat_array(self.log, copy=False).dq[0]), copy=False).exp()
+
+    def sample_n(self, n: int) :
+        '''
+        Returns n equally spaced dual quaternions interpolated between start and stop.
+
+        Args
+        ---
+        n : int
+            Number of interpolated dual quaternions to return
+
+        Returns
+        ---
+        dqs : dual_quat_array
+        '''
+        if n > 0 :
+            d_tau = 1 / (n + 1)
+        else :
+            raise ZeroDivisionError
+
+        import numpy as np
+
+        return self(np.arange(1, n + 1) * d_tau)
@@ -0,0 +1,603 @@
+from .quat import quat
+from .quat_array import quat_array, qmul
+from .dual_quat import dual_quat
+from .dual_num_array import dual_num_array
+from . import validation
+import numpy as np
+
+def dqmul(a, b, out = None) :
+    '''
+    Batched dual quaternion multiplication a * b along the last axis.
+
+    dq2 = a.r * b.r + e * (a.r * b.d + a.d * b.r)
+
+    Leading dimensions are broadcast against each other, so one dual quaternion may be multiplied against many.
+
+    Args
+    ---
+    a : ndarray
+        (..., 8) left side dual quaternions, real part first
+    b : ndarray
+        (..., 8) right side dual quaternions, real part first
+    out : ndarray, opt.
+        Array to write the result into, may be a or b
+
+    Returns
+    ---
+    out : ndarray
+        (..., 8) products a * b
+    '''
+    ar, ad = a[..., :4], a[..., 4:]
+    br, bd = b[..., :4], b[..., 4:]
+
+    r = qmul(ar, br)
+    d = qmul(ar, bd)
+    d += qmul(ad, br)
+
+    if out is None :
+        out = np.empty(np.broadcast_shapes(a.shape, b.shape))
+
+    out[..., :4] = r
+    out[..., 4:] = d
+
+    return out
+
+class dual_quat_array() :
+    # Defer arithmetic with ndarrays to the reflected operators below
+    __array_ufunc__ = None
+
+    def __init__(self, dq = [[1, 0, 0, 0, 0, 0, 0, 0]], copy: bool = True) :
+        '''
+        Construct an array of dual quaternions backed by a contiguous (N, 8) float64 buffer.
+
+        Args
+        ---
+        dq : array_like, dual_quat, list[dual_quat] or dual_quat_array, opt.
+            (N, 8) or (8,) dual quaternions with the real quaternion in the first four columns
+        copy : bool, opt.
+            Whether to copy an existing array or container, by default True so the new array never shares memory with the one given
+        '''
+        if isinstance(dq, dual_quat_array) :
+            dq = dq.dq
+        elif isinstance(dq, dual_quat) :
+            dq = [_as_row(dq)]
+        elif isinstance(dq, list) and len(dq) > 0 and isinstance(dq[0], dual_quat) :
+            dq = [_as_row(p) for p in dq]
+
+        dq = np.array(dq, dtype=np.float64, order='C') if copy else np.ascontiguousarray(dq, dtype=np.float64)
+        if dq.ndim == 1 and dq.shape[0] == 8 :
+            dq = dq.reshape(1, 8)
+        elif dq.ndim == 1 and dq.shape[0] == 0 :
+            dq = dq.reshape(0, 8)
+        elif dq.ndim != 2 or dq.shape[1] != 8 :
+            raise ValueError(f'Expected an (N, 8) array of dual quaternions, got shape {dq.shape}')
+
+        self.dq = dq
+
+    def from_parts(real, dual) :
+        '''
+        Constructs a dual quaternion array from its real and dual quaternions.
+
+        Args
+        ---
+        real : quat_array or array_like
+            (N, 4) real components
+        dual : quat_array or array_like
+            (N, 4) dual components
+        '''
+        real = real.q if isinstance(real, quat_array) else np.asarray(real, dtype=np.float64)
+        dual = dual.q if isinstance(dual, quat_array) else np.asarray(dual, dtype=np.float64)
+
+        return dual_quat_array(np.concatenate(np.broadcast_arrays(real, dual), axis=-1), copy=False)
+
+    def from_dual_quats(dqs: list[dual_quat]) :
+        '''
+        Constructs a dual quaternion array from a list of dual quaternions.
+
+        Args
+        ---
+        dqs : list[dual_quat]
+            The dual quaternions to store
+        '''
+        return dual_quat_array(list(dqs))
+
+    def as_dual_quats(self) :
+        '''
+        Returns the dual quaternion array as a list of dual quaternions.
+
+        Returns
+        ---
+        dqs : list[dual_quat]
+        '''
+        return [_from_row(row) for row in self.dq.tolist()]
+
+    @property
+    def r(self) :
+        return quat_array(self.dq[:, :4], copy=False)
+
+    @property
+    def d(self) :
+        return quat_array(self.dq[:, 4:], copy=False)
+
+    def from_trans(translation, rotation, check: bool = None) :
+        '''
+        Constructs dual quaternions representing transformations of a translation followed by a rotation.
+
+        dual_quat = rotation + epsilon * (1/2 translation * rotation)
+
+        Args
+        ---
+        translation : array_like
+            (N, 3) translation vectors or (N, 4) pure quaternions, or a single translation for every rotation
+        rotation : quat_array or array_like
+            (N, 4) unit quaternions, or a single rotation for every translation
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+        '''
+        translation = np.asarray(translation, dtype=np.float64)
+        if translation.shape[-1] == 3 :
+            qt = np.zeros(translation.shape[:-1] + (4,))
+            qt[..., 1:] = translation
+        elif translation.shape[-1] == 4 :
+            qt = translation
+            if np.any(qt[..., 0] != 0) :
+                raise BaseException('Translations must be pure quaternions')
+        else :
+            raise ValueError(f'Expected (N, 3) or (N, 4) translations, got shape {translation.shape}')
+
+        if isinstance(rotation, quat_array) :
+            if validation.should_check(check) and not np.all(rotation.is_unit()) :
+                raise BaseException('Rotations must be unit quaternions')
+            qr = rotation.q
+        elif isinstance(rotation, quat) :
+            if validation.should_check(check) and not rotation.is_unit() :
+                raise BaseException(f'Rotation {rotation} must be a unit quaternion')
+            qr = np.array([rotation.w, rotation.x, rotation.y, rotation.z])
+        else :
+            qr = np.asarray(rotation, dtype=np.float64)
+
+        return dual_quat_array.from_parts(*np.broadcast_arrays(qr, 0.5 * qmul(qt, qr)))
+
+    def as_trans(self, check: bool = None) :
+        '''
+        Returns the translations and rotations defined by unit dual quaternions.
+
+        dq = A + eB
+
+        Args
+        ---
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        translation : ndarray
+            (N, 3) translation vectors 2 * B * A^-1
+        rotation : quat_array
+            Rotation quaternions A
+        '''
+        if not validation.should_check(check) or np.all(self.is_unit()) :
+            r_conj = self.dq[:, :4] * [1, -1, -1, -1]
+            vec = 2 * qmul(self.dq[:, 4:], r_conj)
+            return vec[:, 1:], self.r
+        else :
+            raise BaseException('Only unit dual quaternions are valid representations of 3D transforms')
+
+    def as_matrix(self, check: bool = None) :
+        '''
+        Returns the homogeneous transformation matrices represented by the unit dual quaternions.
+
+        Args
+        ---
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        mat : ndarray
+            (N, 4, 4) homogeneous transformation matrices
+        '''
+        vec, rot = self.as_trans(check)
+
+        mat = np.zeros((len(self), 4, 4))
+        mat[:, :3, :3] = rot.as_matrix(False)
+        mat[:, :3, 3] = vec
+        mat[:, 3, 3] = 1
+        return mat
+
+    def from_matrix(mat) :
+        '''
+        Constructs unit dual quaternions from homogeneous transformation matrices.
+
+        Args
+        ---
+        mat : array_like
+            (N, 4, 4) homogeneous transformation matrices
+        '''
+        mat = np.asarray(mat, dtype=np.float64)
+        return dual_quat_array.from_trans(mat[:, :3, 3], quat_array.from_matrix(mat[:, :3, :3]), False)
+
+    def from_screw(u, m, theta, d) :
+        '''
+        Constructs unit dual quaternions from the screw parameters of transforms.
+
+        Args
+        ---
+        u : array_like
+            (N, 3) unit vectors representing the screw axes, or a single (3,) axis
+        m : array_like
+            (N, 3) moment vectors, or a single (3,) moment
+        theta : array_like
+            (N,) rotation angles
+        d : array_like
+            (N,) displacement distances
+        '''
+        u = np.asarray(u, dtype=np.float64)
+        m = np.asarray(m, dtype=np.float64)
+        theta = np.asarray(theta, dtype=np.float64) / 2
+        cos = np.cos(theta)
+        sin = np.sin(theta)
+        coef = np.asarray(d, dtype=np.float64) / 2
+
+        dq = np.empty(np.broadcast_shapes(u.shape[:-1], m.shape[:-1], cos.shape, coef.shape) + (8,))
+        dq[..., 0] = cos
+        dq[..., 1:4] = u * sin[..., None]
+        dq[..., 4] = -coef * sin
+        dq[..., 5:] = (coef * cos)[..., None] * u + sin[..., None] * m
+        return dual_quat_array(dq, copy=False)
+
+    def as_screw(self, check: bool = None) :
+        '''
+        Returns the screw parameters of unit dual quaternions.
+
+        Unlike dual_quat.as_screw, pure translations are supported, with the axis along the translation, a zero moment and a zero angle.
+
+        Args
+        ---
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        u : ndarray
+            (N, 3) unit vectors representing the screw axes
+        m : ndarray
+            (N, 3) moment vectors
+        theta : ndarray
+            (N,) rotation angles
+        d : ndarray
+            (N,) displacement distances
+        '''
+        vec, _ = self.as_trans(check)
+        w, v = self.dq[:, 0], self.dq[:, 1:4]
+
+        sin = np.linalg.norm(v, axis=1)
+        theta = 2 * np.arctan2(sin, w)
+        pure = sin <= 1e-12
+        sin = np.where(pure, 1, sin)
+
+        # Without a rotation the axis is along the translation
+        length = np.linalg.norm(vec, axis=1)
+        u = np.where(pure[:, None], vec / np.where(length > 0, length, 1)[:, None], v / sin[:, None])
+        d = np.einsum('ij,ij->i', vec, u)
+
+        cotan = w / sin
+        m = 0.5 * (np.cross(vec, u) + (vec - d[:, None] * u) * cotan[:, None])
+        m[pure] = 0
+
+        return u, m, np.where(pure, 0, theta), d
+
+    def exp(self) :
+        '''
+        Returns the exponential of each dual quaternion.
+
+        exp(A + eB) = exp(A) + e D exp(A)[B], the dual part being the derivative of the quaternion exponential at A along B.
+        '''
+        w, a = self.dq[:, 0], self.dq[:, 1:4]
+        dw, b = self.dq[:, 4], self.dq[:, 5:]
+
+        phi_sq = np.einsum('ij,ij->i', a, a)
+        phi = np.sqrt(phi_sq)
+        dot = np.einsum('ij,ij->i', a, b)
+
+        scale = np.exp(w)
+        cos = np.cos(phi)
+        sinc = np.sinc(phi / np.pi)
+
+        # Derivative of sinc(phi) / phi, using its Taylor series near 0
+        small = phi < 1e-4
+        coef = np.where(small, -1 / 3 + phi_sq / 30, (cos - sinc) / np.where(small, 1, phi_sq))
+
+        real = scale * sinc
+        out = np.empty_like(self.dq)
+        out[:, 0] = scale * cos
+        out[:, 1:4] = real[:, None] * a
+        out[:, 4] = scale * (dw * cos - sinc * dot)
+        out[:, 5:] = (scale * (dw * sinc + coef * dot))[:, None] * a + real[:, None] * b
+        return dual_quat_array(out, copy=False)
+
+    def log(self, check: bool = None) :
+        '''
+        Returns the logarithm of each unit dual quaternion, the inverse of exp.
+
+        The logarithm is the pure dual quaternion (0, theta/2 u) + e(0, d/2 u + theta/2 m) of the screw (u, m, theta, d), which is defined for pure translations too.
+
+        Args
+        ---
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        log : dual_quat_array
+        '''
+        if validation.should_check(check) and not np.all(self.is_unit()) :
+            raise BaseException('Only unit dual quaternions are valid representations of 3D transforms')
+
+        a = quat_array(self.dq[:, :4], copy=False).log().q[:, 1:]
+
+        # Half the translation, the vector part of B A*
+        h = qmul(self.dq[:, 4:], self.dq[:, :4] * [1, -1, -1, -1])[:, 1:]
+
+        # (1 - phi cot(phi)) / phi^2, using its Taylor series near 0
+        phi_sq = np.einsum('ij,ij->i', a, a)
+        phi = np.sqrt(phi_sq)
+        small = phi < 1e-4
+        turn = np.pi - phi < 1e-8
+        safe = np.where(small | turn, 1, phi)
+        coef = np.where(small, 1 / 3 + phi_sq / 45, (1 - safe * np.cos(safe) / np.sin(safe)) / (safe * safe))
+
+        # A whole turn is no rotation, so the screw is along the translation with no moment, any other axis would need an infinite moment
+        h_norm = np.linalg.norm(h, axis=1)
+        along = turn & (h_norm > 0)
+        a[along] = (phi[along] / h_norm[along])[:, None] * h[along]
+        coef[turn] = 0
+
+        cross = np.cross(a, h)
+        out = np.zeros_like(self.dq)
+        out[:, 1:4] = a
+        out[:, 5:] = h - cross + coef[:, None] * np.cross(a, cross)
+        return dual_quat_array(out, copy=False)
+
+    def integrate(self, omega, v, dt) :
+        '''
+        Integrates constant twists over a time step, exactly rather than by Euler steps.
+
+        dq(t + dt) = dq(t) exp((omega + e v) dt / 2)
+
+        Args
+        ---
+        omega : array_like
+            (N, 3) angular velocities in radians per unit time, in the frame of each transform, or a single (3,) velocity
+        v : array_like
+            (N, 3) linear velocities, in the frame of each transform, or a single (3,) velocity
+        dt : float or array_like
+            The time step, or (N,) time steps
+
+        Returns
+        ---
+        dqs : dual_quat_array
+            The transforms after the time step
+        '''
+        half = _as_scale(dt) / 2
+        omega = np.asarray(omega, dtype=np.float64) * half
+        v = np.asarray(v, dtype=np.float64) * half
+
+        step = np.zeros(np.broadcast_shapes(omega.shape, v.shape)[:-1] + (8,))
+        step[..., 1:4] = omega
+        step[..., 5:] = v
+
+        return dual_quat_array(dqmul(self.dq, dual_quat_array(step, copy=False).exp().dq), copy=False)
+
+    def q_conj(self) :
+        '''
+        Returns the quaternion conjugate of each dual quaternion.
+
+        dq = A + eB -> dq* = A* + eB*
+        '''
+        return dual_quat_array(self.dq * [1, -1, -1, -1, 1, -1, -1, -1], copy=False)
+
+    def d_conj(self) :
+        '''
+        Returns the dual number conjugate of each dual quaternion.
+
+        dq = A + eB -> bar{dq} = A - eB
+        '''
+        return dual_quat_array(self.dq * [1, 1, 1, 1, -1, -1, -1, -1], copy=False)
+
+    def t_conj(self) :
+        '''
+        Returns the total conjugate of each dual quaternion.
+
+        dq = A + eB -> bar{dq*} = A* - eB*
+        '''
+        return dual_quat_array(self.dq * [1, -1, -1, -1, -1, 1, 1, 1], copy=False)
+
+    def inv(self) :
+        '''Returns the dual quaternion inverse of each dual quaternion.'''
+        r_conj = self.dq[:, :4] * [1, -1, -1, -1]
+        return dual_quat_array.from_parts(r_conj, -1 * qmul(qmul(r_conj, self.dq[:, 4:]), r_conj))
+
+    def norm(self) :
+        '''Returns the 2 norm of each dual quaternion as a dual_num_array.'''
+        norm = dqmul(self.dq, self.q_conj().dq)
+
+        return dual_num_array(norm[:, 0], norm[:, 4]).sqrt()
+
+    def normalized(self) :
+        '''
+        Returns the normalized dual quaternions.
+
+        dq = A + eB -> dq / ||dq|| = A / |A| + e (B - A' <A', B>) / |A|, with A' = A / |A|
+        '''
+        return dual_quat_array(self.dq).normalize_()
+
+    def normalize_(self) :
+        '''
+        Normalizes the dual quaternions in place and returns them.
+        '''
+        r, d = self.dq[:, :4], self.dq[:, 4:]
+        norm = np.linalg.norm(r, axis=1, keepdims=True)
+        r /= norm
+
+        d -= np.einsum('ij,ij->i', r, d)[:, None] * r
+        d /= norm
+        return self
+
+    def is_unit(self) :
+        '''Returns a mask of which dual quaternions are unit dual quaternions.'''
+        r = self.r
+        return r.is_unit() & r.is_orth(self.dq[:, 4:])
+
+    def cumprod(self, workers: int = 1, executor = None) :
+        '''
+        Returns the cumulative products of the dual quaternions, out[i] = self[0] * self[1] * ... * self[i].
+
+        Args
+        ---
+        workers : int, opt.
+            Number of blocks to scan in parallel, a thread pool of this size is used unless an executor is given
+        executor : concurrent.futures.Executor, opt.
+            Executor to scan the blocks with, such as a ProcessPoolExecutor
+
+        Returns
+        ---
+        dqs : dual_quat_array
+        '''
+        from .scan import cumulative_compose
+        return cumulative_compose(self, workers, executor)
+
+    def mean(self, weights = None, check: bool = None) :
+        '''
+        Returns the weighted mean of the unit dual quaternions.
+
+        The rotation is averaged by the eigenvector method and the translation is the weighted mean of the translations.
+        Use averaging.dual_quat_mean to average sets too large to hold in memory at once.
+
+        Args
+        ---
+        weights : array_like, opt.
+            (N,) non negative weight of each dual quaternion, by default 1
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        dq : dual_quat
+        '''
+        from .averaging import dual_quat_mean
+        return dual_quat_mean().add(self, weights, check).result()
+
+    def __len__(self) :
+        return self.dq.shape[0]
+
+    def __getitem__(self, idx) :
+        '''Returns a dual_quat for an integer index, otherwise a dual_quat_array, which is a view for a slice as in NumPy.'''
+        if isinstance(idx, (int, np.integer)) :
+            return _from_row(self.dq[idx].tolist())
+        return dual_quat_array(self.dq[idx], copy=False)
+
+    def __setitem__(self, idx, p) :
+        self.dq[idx] = _as_array(p)
+
+    def __iter__(self) :
+        for row in self.dq.tolist() :
+            yield _from_row(row)
+
+    def __add__(self, p) :
+        '''Dual quaternion addition.'''
+        return dual_quat_array(self.dq + _as_array(p), copy=False)
+
+    def __mul__(self, p) :
+        '''
+        Dual quaternion multiplication self * p when p is a dual_quat or dual_quat_array, otherwise multiplication by scalars.
+
+        Args
+        ---
+        p : dual_quat, dual_quat_array, float or array_like
+            Right side dual quaternions, or a scalar or (N,) array of scalars
+
+        Returns
+        ---
+        dq2 : dual_quat_array
+        '''
+        if isinstance(p, (dual_quat, dual_quat_array)) :
+            return dual_quat_array(dqmul(self.dq, _as_array(p)), copy=False)
+        return dual_quat_array(self.dq * _as_scale(p), copy=False)
+
+    def mul_into(a, b, out) :
+        '''
+        Dual quaternion multiplication a * b written into an existing dual quaternion array.
+
+        Args
+        ---
+        a : dual_quat or dual_quat_array
+            Left side dual quaternions
+        b : dual_quat or dual_quat_array
+            Right side dual quaternions
+        out : dual_quat_array
+            The dual quaternion array to overwrite with the products, may be a or b
+
+        Returns
+        ---
+        out : dual_quat_array
+        '''
+        dqmul(_as_array(a), _as_array(b), out.dq)
+        return out
+
+    def __rmul__(self, p) :
+        '''Dual quaternion multiplication p * self by a dual_quat, otherwise multiplication by scalars.'''
+        if isinstance(p, dual_quat) :
+            return dual_quat_array(dqmul(_as_array(p), self.dq), copy=False)
+        return dual_quat_array(self.dq * _as_scale(p), copy=False)
+
+    def __truediv__(self, p) :
+        '''Scalar division by a scalar or (N,) array of scalars.'''
+        return dual_quat_array(self.dq / _as_scale(p), copy=False)
+
+    def __imul__(self, p) :
+        '''In place dual quaternion multiplication self * p, or multiplication by scalars.'''
+        if isinstance(p, (dual_quat, dual_quat_array)) :
+            dqmul(self.dq, _as_array(p), self.dq)
+        else :
+            self.dq *= _as_scale(p)
+        return self
+
+    def __iadd__(self, p) :
+        '''In place dual quaternion addition.'''
+        self.dq += _as_array(p)
+        return self
+
+    def __itruediv__(self, p) :
+        '''In place scalar division.'''
+        self.dq /= _as_scale(p)
+        return self
+
+    def __pow__(self, p) :
+        '''Unit dual quaternions raised to the power p, exp(p log(dq)), where p is a scalar or (N,) array.'''
+        return dual_quat_array(_as_scale(p) * self.log().dq, copy=False).exp()
+
+    def __str__(self) :
+        return f'dual_quat_array({len(self)}):\n{self.dq}'
+
+def _as_row(dq: dual_quat) :
+    '''Returns the eight components of a dual quaternion as a tuple.'''
+    r, d = dq.r, dq.d
+    return (r.w, r.x, r.y, r.z, d.w, d.x, d.y, d.z)
+
+def _from_row(row: list[float]) :
+    '''Returns a dual quaternion from its eight components.'''
+    return dual_quat._new(quat._new(*row[:4]), quat._new(*row[4:]))
+
+def _as_array(p) :
+    '''Returns the raw (N, 8) or (8,) array behind a dual_quat, dual_quat_array or array_like.'''
+    if isinstance(p, dual_quat_array) :
+        return p.dq
+    elif isinstance(p, dual_quat) :
+        return np.array(_as_row(p))
+    return np.asarray(p, dtype=np.float64)
+
+def _as_scale(p) :
+    '''Returns a scalar or (N,) array of scalars shaped to broadcast against an (N, 8) array.'''
+    p = np.asarray(p, dtype=np.float64)
+    return p[..., None] if p.ndim > 0 else p
@@ -0,0 +1,160 @@
+from . import quat
+from . import dual_quat
+from . import dual_num
+from contextlib import contextmanager
+import functools
+import time
+import types
+
+# Modules whose classes are instrumented
+MODULES = (quat, dual_quat, dual_num)
+
+# Methods which create a new object of their class
+CONSTRUCTORS = ('__init__', '_new')
+
+# Operation name to [calls, cumulative seconds], only updated while enabled
+_stats = {}
+
+# Original methods replaced while enabled, as (class, name, function)
+_originals = []
+
+# Number of active instrumented blocks, so nested blocks do not disable early
+_depth = 0
+
+def enable() :
+    '''
+    Replaces every method of the classes in quat, dual_quat and dual_num with a wrapper counting its calls and time.
+
+    The classes are left untouched until enabled, so instrumentation costs nothing when it is not in use.
+    '''
+    if _originals :
+        return
+
+    for module in MODULES :
+        for cls in vars(module).values() :
+            if not isinstance(cls, type) or cls.__module__ != module.__name__ :
+                continue
+
+            for name, func in list(vars(cls).items()) :
+                if isinstance(func, types.FunctionType) :
+                    _originals.append((cls, name, func))
+                    setattr(cls, name, _wrap(func, f'{cls.__name__}.{name}'))
+
+def disable() :
+    '''Restores the original methods, the counters are kept until reset.'''
+    while _originals :
+        cls, name, func = _originals.pop()
+        setattr(cls, name, func)
+
+def is_enabled() :
+    '''Returns whether instrumentation is enabled.'''
+    return bool(_originals)
+
+def reset() :
+    '''Clears the counters.'''
+    _stats.clear()
+
+@contextmanager
+def instrumented(clear: bool = True) :
+    '''
+    Context manager which enables instrumentation for the duration of the block.
+
+    Args
+    ---
+    clear : bool, opt.
+        Whether to reset the counters on entering the block
+
+    Yields
+    ---
+    stats : dict
+        Filled with the report on leaving the block
+    '''
+    global _depth
+
+    if clear :
+        reset()
+
+    stats = {}
+    enable()
+    _depth += 1
+    try :
+        yield stats
+    finally :
+        _depth -= 1
+        if _depth == 0 :
+            disable()
+        stats.update(report())
+
+def report() :
+    '''
+    Returns the counters of every operation called while enabled.
+
+    Returns
+    ---
+    stats : dict
+        Maps each operation, such as 'quat.__mul__', to its number of calls, cumulative seconds including nested operations, and seconds per call.
+        The objects created of each class are under 'created', such as 'created.quat', counting calls of __init__ and _new.
+    '''
+    stats = {}
+    created = {}
+
+    for name, (calls, seconds) in _stats.items() :
+        stats[name] = {'calls': calls, 'time': seconds, 'per_call': seconds / calls}
+
+        cls, method = name.split('.')
+        if method in CONSTRUCTORS :
+            created[cls] = created.get(cls, 0) + calls
+
+    for cls, count in created.items() :
+        stats[f'created.{cls}'] = {'calls': count}
+
+    return stats
+
+def format_report(stats: dict = None, sort: str = 'time', limit: int = None) :
+    '''
+    Formats a report as a table.
+
+    Args
+    ---
+    stats : dict, opt.
+        The report to format, by default the current counters
+    sort : str, opt.
+        The column to sort the operations by from ['time', 'calls']
+    limit : int, opt.
+        Maximum number of operations to list
+
+    Returns
+    ---
+    table : str
+    '''
+    if stats is None :
+        stats = report()
+
+    ops = sorted((item for item in stats.items() if 'time' in item[1]), key=lambda item : item[1][sort], reverse=True)
+    lines = [f'{"operation":<32}{"calls":>10}{"total ms":>12}{"per call us":>14}']
+    for name, op in ops[:limit] :
+        lines.append(f'{name:<32}{op["calls"]:>10}{op["time"] * 1e3:>12.3f}{op["per_call"] * 1e6:>14.3f}')
+
+    for name, op in stats.items() :
+        if name.startswith('created.') :
+            lines.append(f'{name:<32}{op["calls"]:>10}')
+
+    return '\n'.join(lines)
+
+def _wrap(func, name: str) :
+    '''Returns a wrapper of func which adds its calls and time to the counters of name.'''
+    perf_counter = time.perf_counter
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs) :
+        start = perf_counter()
+        try :
+            return func(*args, **kwargs)
+        finally :
+            stat = _stats.get(name)
+            if stat is None :
+                stat = _stats[name] = [0, 0.0]
+            stat[0] += 1
+            stat[1] += perf_counter() - start
+
+    return wrapper
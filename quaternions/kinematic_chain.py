@@ -0,0 +1,158 @@
+from .quat import quat
+from .dual_quat import dual_quat
+from .dual_quat_array import dual_quat_array, dqmul
+import numpy as np
+
+class kinematic_chain() :
+    def __init__(self, joints) :
+        '''
+        A serial chain of joint transforms with cached prefix products for forward kinematics.
+
+        The pose of link k is joints[0] * joints[1] * ... * joints[k].  Changing joint k only invalidates the cached poses from link k onwards.
+
+        Args
+        ---
+        joints : list[dual_quat] or dual_quat_array
+            Unit dual quaternions of each joint transform from the base outwards
+        '''
+        self.joints = [dual_quat._new(joint.r.copy(), joint.d.copy()) for joint in joints]
+        self.prefix = [dual_quat._new(quat(), quat()) for _ in self.joints]
+
+        # Links before this index have up to date cached poses
+        self.valid = 0
+
+    def __len__(self) :
+        return len(self.joints)
+
+    def set_joint(self, k: int, joint: dual_quat) :
+        '''
+        Replaces the transform of joint k.
+
+        Args
+        ---
+        k : int
+            Index of the joint to replace
+        joint : dual_quat
+            The new unit dual quaternion transform of the joint
+        '''
+        k = self._index(k)
+        _assign(self.joints[k], joint)
+        self.valid = min(self.valid, k)
+
+    def set_joints(self, joints, start: int = 0) :
+        '''
+        Replaces the transforms of consecutive joints.
+
+        Args
+        ---
+        joints : list[dual_quat] or dual_quat_array
+            The new unit dual quaternion transforms
+        start : int, opt.
+            Index of the first joint to replace
+        '''
+        start = self._index(start)
+        if start + len(joints) > len(self) :
+            raise IndexError(f'Cannot set {len(joints)} joints from {start} in a chain of {len(self)}')
+
+        for k, joint in enumerate(joints, start) :
+            _assign(self.joints[k], joint)
+        self.valid = min(self.valid, start)
+
+    def link_pose(self, k: int) :
+        '''
+        Returns the pose of link k, only updating the cached poses up to it.
+
+        Returns
+        ---
+        pose : dual_quat
+        '''
+        k = self._index(k)
+        self._update(k + 1)
+        pose = self.prefix[k]
+        return dual_quat._new(pose.r.copy(), pose.d.copy())
+
+    def end_effector(self) :
+        '''
+        Returns the pose of the final link.
+
+        Returns
+        ---
+        pose : dual_quat
+        '''
+        return self.link_pose(-1)
+
+    def link_poses(self) :
+        '''
+        Returns the poses of every link.
+
+        Returns
+        ---
+        poses : dual_quat_array
+            (J, 8) poses of each link from the base outwards
+        '''
+        self._update(len(self))
+        return dual_quat_array(self.prefix)
+
+    def evaluate(self, configs, start: int = 0) :
+        '''
+        Evaluates the link poses for many joint configurations at once.
+
+        The joints before start are taken from the chain, so their cached poses are shared by every configuration.
+
+        Args
+        ---
+        configs : array_like
+            (B, J - start, 8) joint transforms for each configuration, replacing the joints from start onwards
+        start : int, opt.
+            Index of the first joint given in configs
+
+        Returns
+        ---
+        poses : ndarray
+            (B, J, 8) poses of each link for each configuration
+        '''
+        configs = np.asarray(configs, dtype=np.float64)
+        count = len(self)
+        if configs.ndim != 3 or configs.shape[1:] != (count - start, 8) :
+            raise ValueError(f'Expected configurations of shape (B, {count - start}, 8), got shape {configs.shape}')
+
+        poses = np.empty((configs.shape[0], count, 8))
+        if start > 0 :
+            self._update(start)
+            poses[:, :start] = dual_quat_array(self.prefix[:start]).dq
+        else :
+            poses[:, 0] = configs[:, 0]
+
+        for i in range(max(start, 1), count) :
+            dqmul(poses[:, i - 1], configs[:, i - start], poses[:, i])
+
+        return poses
+
+    def _index(self, k: int) :
+        '''Returns the joint index k counted from the base, counting negative indices from the end like a list.'''
+        if k < 0 :
+            k += len(self)
+        if not 0 <= k < len(self) :
+            raise IndexError(f'Joint index out of range for a chain of {len(self)}')
+        return k
+
+    def _update(self, upto: int) :
+        '''Brings the cached poses of the links before upto up to date.'''
+        if self.valid >= upto :
+            return
+
+        joints, prefix = self.joints, self.prefix
+        if self.valid == 0 :
+            _assign(prefix[0], joints[0])
+            self.valid = 1
+
+        for i in range(self.valid, upto) :
+            dual_quat.mul_into(prefix[i - 1], joints[i], prefix[i])
+
+        self.valid = upto
+
+def _assign(out: dual_quat, dq: dual_quat) :
+    '''Copies the components of dq into out without allocating.'''
+    r, d = out.r, out.d
+    r.w, r.x, r.y, r.z = dq.r.w, dq.r.x, dq.r.y, dq.r.z
+    d.w, d.x, d.y, d.z = dq.d.w, dq.d.x, dq.d.y, dq.d.z
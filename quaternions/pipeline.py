@@ -0,0 +1,150 @@
+from .quat import quat
+from .quat_array import quat_array
+from .dual_quat import dual_quat
+from .dual_quat_array import dual_quat_array
+import numpy as np
+
+MODES = ('sclerp', 'lerp', 'slerp')
+
+def expand(keypoints, n: int, mode: str = 'sclerp') :
+    '''
+    Lazily expands keypoints into a trajectory, yielding each keypoint followed by n interpolated poses towards the next.
+
+    Only one segment is interpolated at a time, so memory use does not grow with the length of the path.
+
+    Args
+    ---
+    keypoints : iterable of dual_quat or quat
+        The keypoints to pass through, quat keypoints are used with the slerp mode
+    n : int
+        Number of interpolated poses between each pair of keypoints
+    mode : str, opt.
+        The interpolation from ['sclerp', 'lerp', 'slerp']
+        sclerp interpolates along the screw between dual quaternions, lerp interpolates the translation linearly and the rotation with SLERP, slerp interpolates only the rotations with SLERP and yields quats
+
+    Yields
+    ---
+    pose : dual_quat or quat
+    '''
+    for segment in _segments(keypoints, n, mode) :
+        yield from segment
+
+def expand_chunks(keypoints, n: int, chunk_size: int, mode: str = 'sclerp') :
+    '''
+    Lazily expands keypoints into a trajectory, yielding fixed size batches of poses.
+
+    The poses are the same as from expand, grouped into arrays for downstream stages which work in batches.
+
+    Args
+    ---
+    keypoints : iterable of dual_quat or quat
+        The keypoints to pass through, quat keypoints are used with the slerp mode
+    n : int
+        Number of interpolated poses between each pair of keypoints
+    chunk_size : int
+        Number of poses in each chunk, the final chunk may be shorter
+    mode : str, opt.
+        The interpolation from ['sclerp', 'lerp', 'slerp']
+
+    Yields
+    ---
+    chunk : dual_quat_array or quat_array
+    '''
+    yield from chunked(_segments(keypoints, n, mode), chunk_size)
+
+def chunked(segments, chunk_size: int) :
+    '''
+    Regroups a stream of pose arrays into arrays of a fixed size.
+
+    Args
+    ---
+    segments : iterable of dual_quat_array or quat_array
+        Batches of poses of any length
+    chunk_size : int
+        Number of poses in each chunk, the final chunk may be shorter
+
+    Yields
+    ---
+    chunk : dual_quat_array or quat_array
+    '''
+    if chunk_size < 1 :
+        raise ValueError(f'The chunk size {chunk_size} must be at least 1')
+
+    pending = []
+    count = 0
+    kind = None
+
+    for segment in segments :
+        kind = type(segment)
+        rows = _rows(segment)
+
+        while rows.shape[0] > 0 :
+            take = min(chunk_size - count, rows.shape[0])
+            pending.append(rows[:take])
+            count += take
+            rows = rows[take:]
+
+            if count == chunk_size :
+                yield kind(np.concatenate(pending))
+                pending = []
+                count = 0
+
+    if count > 0 :
+        yield kind(np.concatenate(pending))
+
+def translations(poses) :
+    '''
+    Lazily extracts the translation of each pose in a stream.
+
+    Args
+    ---
+    poses : iterable of dual_quat or dual_quat_array
+        Single poses or batches of poses, such as from expand or expand_chunks
+
+    Yields
+    ---
+    translation : list or ndarray
+        A translation vector for each dual_quat, or (N, 3) translations for each dual_quat_array
+    '''
+    for pose in poses :
+        vec, _ = pose.as_trans()
+        yield vec
+
+def _segments(keypoints, n: int, mode: str) :
+    '''Yields the first keypoint, then for each following keypoint the interpolated poses leading to it and the keypoint itself.'''
+    if mode not in MODES :
+        raise ValueError(f'Unknown interpolation mode {mode}, expected one of {MODES}')
+    elif n < 0 :
+        raise ValueError(f'The number of interpolated poses {n} must not be negative')
+
+    prev = None
+    for point in keypoints :
+        if mode == 'slerp' and isinstance(point, dual_quat) :
+            point = point.r
+
+        if prev is not None and n > 0 :
+            yield _batch(_interp(prev, point, n, mode))
+
+        yield _batch(point)
+        prev = point
+
+def _interp(start, stop, n: int, mode: str) :
+    '''Interpolates n poses between two keypoints.'''
+    if mode == 'sclerp' :
+        return start.sclerp_plan(stop).sample_n(n)
+    elif mode == 'lerp' :
+        return dual_quat_array(start.lerp_n(stop, n))
+    else :
+        return start.slerp_n(stop, n)
+
+def _batch(pose) :
+    '''Wraps single poses into a batch.'''
+    if isinstance(pose, dual_quat) :
+        return dual_quat_array(pose)
+    elif isinstance(pose, quat) :
+        return quat_array(pose)
+    return pose
+
+def _rows(batch) :
+    '''Returns the raw rows behind a batch of poses.'''
+    return batch.dq if isinstance(batch, dual_quat_array) else batch.q
@@ -0,0 +1,177 @@
+from .quat_array import quat_array
+from .dual_quat_array import dual_quat_array, dqmul
+from . import validation
+import numpy as np
+
+MODES = ('sclerp', 'lerp')
+
+class pose_track() :
+    def __init__(self, timestamps, poses, mode: str = 'sclerp', check: bool = None) :
+        '''
+        A stream of unit dual quaternion poses at sorted timestamps, which can be resampled at any times within the track.
+
+        The bracketing poses of each requested time are found with a vectorized binary search, and the interpolation parameters of each segment are computed once on first use.
+        They are the logarithm of its relative transform for sclerp, and its translation step and rotation angle for lerp.
+        The poses and parameters are stored in buffers which double when full, so a stream can be extended one pose at a time.
+
+        Args
+        ---
+        timestamps : array_like
+            (N,) strictly increasing timestamps of each pose
+        poses : dual_quat_array, list[dual_quat] or array_like
+            (N, 8) unit dual quaternions of the track
+        mode : str, opt.
+            The interpolation from ['sclerp', 'lerp']
+            sclerp interpolates along the screw between poses, lerp interpolates the translation linearly and the rotation with SLERP
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+        '''
+        if mode not in MODES :
+            raise ValueError(f'Unknown interpolation mode {mode}, expected one of {MODES}')
+
+        self.mode = mode
+
+        # times and poses are views of the filled rows of their buffers
+        self.time_buffer = np.empty(0)
+        self.pose_buffer = np.empty((0, 8))
+        self.times = self.time_buffer
+        self.poses = self.pose_buffer
+
+        # Interpolation parameters of the segments computed so far, params are views of the filled rows of their buffers
+        self.param_buffers = None
+        self.params = None
+        self.param_count = 0
+
+        self.extend(timestamps, poses, check)
+
+    def __len__(self) :
+        return self.times.shape[0]
+
+    def extend(self, timestamps, poses, check: bool = None) :
+        '''
+        Appends poses to the end of the track, the cached segments are kept.
+
+        Args
+        ---
+        timestamps : array_like
+            (M,) strictly increasing timestamps of each pose, after the last timestamp of the track
+        poses : dual_quat_array, list[dual_quat] or array_like
+            (M, 8) unit dual quaternions to append
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+        '''
+        timestamps = np.asarray(timestamps, dtype=np.float64).reshape(-1)
+        poses = dual_quat_array(poses, copy=False)
+
+        if timestamps.shape != (len(poses),) :
+            raise ValueError(f'Expected {len(poses)} timestamps, got shape {timestamps.shape}')
+        elif not np.all(np.diff(np.concatenate([self.times[-1:], timestamps])) > 0) :
+            raise ValueError('Timestamps must be strictly increasing')
+        elif validation.should_check(check) and not np.all(poses.is_unit()) :
+            raise BaseException('Only unit dual quaternions are valid representations of 3D transforms')
+
+        count, added = len(self), timestamps.shape[0]
+        self.time_buffer = _grow(self.time_buffer, count, added)
+        self.pose_buffer = _grow(self.pose_buffer, count, added)
+        self.time_buffer[count:count + added] = timestamps
+        self.pose_buffer[count:count + added] = poses.dq
+
+        self.times = self.time_buffer[:count + added]
+        self.poses = self.pose_buffer[:count + added]
+
+    def at(self, t: float) :
+        '''
+        Returns the pose of the track at a time.
+
+        Args
+        ---
+        t : float
+            Time within the track
+
+        Returns
+        ---
+        dq : dual_quat
+        '''
+        return self.resample([t])[0]
+
+    def resample(self, t) :
+        '''
+        Returns the poses of the track at many times in one batched pass.
+
+        Args
+        ---
+        t : array_like
+            (M,) times within the track, in any order
+
+        Returns
+        ---
+        dqs : dual_quat_array
+            (M, 8) unit dual quaternions interpolated at each time
+        '''
+        t = np.asarray(t, dtype=np.float64).reshape(-1)
+        if len(self) < 2 :
+            if len(self) == 1 and np.all(t == self.times[0]) :
+                return dual_quat_array(np.repeat(self.poses, t.shape[0], axis=0), copy=False)
+            raise BaseException(f'The times {t} must be within the track')
+        elif not np.all((t >= self.times[0]) & (t <= self.times[-1])) :
+            raise BaseException(f'The times {t} must be in [{self.times[0]},{self.times[-1]}]')
+
+        seg = np.clip(np.searchsorted(self.times, t, side='right') - 1, 0, len(self) - 2)
+        tau = (t - self.times[seg]) / (self.times[seg + 1] - self.times[seg])
+
+        params = self._segment_params()
+        if self.mode == 'sclerp' :
+            start, log = params
+            step = dual_quat_array(tau[:, None] * log[seg], copy=False).exp()
+            return dual_quat_array(dqmul(start[seg], step.dq, step.dq), copy=False)
+
+        # SLERP from the cached start rotations, already in the hemisphere of the stops
+        start_vec, delta_vec, start_rot, theta, sin_theta = (param[seg] for param in params)
+        close = sin_theta <= 1e-12
+        sin_theta = np.where(close, 1, sin_theta)
+        c_start = np.where(close, 1 - tau, np.sin((1 - tau) * theta) / sin_theta)
+        c_stop = np.where(close, tau, np.sin(tau * theta) / sin_theta)
+
+        rot = quat_array(c_start[:, None] * start_rot + c_stop[:, None] * self.poses[seg + 1, :4], copy=False)
+        return dual_quat_array.from_trans(start_vec + tau[:, None] * delta_vec, rot, False)
+
+    def _segment_params(self) :
+        '''Returns the interpolation parameters of every segment, computing those of any segments added since the last call.'''
+        count = len(self) - 1
+        if self.param_count == count :
+            return self.params
+
+        # Include the last known pose so the first new segment is covered
+        poses = self.poses[self.param_count:]
+        start, stop = dual_quat_array(poses[:-1]), dual_quat_array(poses[1:], copy=False)
+
+        # Flip the starts into the hemisphere of the stops so each segment takes the short path
+        dot = np.einsum('ij,ij->i', start.dq[:, :4], stop.dq[:, :4])
+        start.dq[dot < 0] *= -1
+
+        if self.mode == 'sclerp' :
+            new = (start.dq, (start.inv() * stop).log(False).dq)
+        else :
+            vec, _ = dual_quat_array(poses, copy=False).as_trans(False)
+            theta = np.arccos(np.minimum(np.abs(dot), 1))
+            new = (vec[:-1], np.diff(vec, axis=0), start.dq[:, :4], theta, np.sin(theta))
+
+        if self.param_buffers is None :
+            self.param_buffers = tuple(np.empty((0,) + param.shape[1:]) for param in new)
+
+        self.param_buffers = tuple(_grow(buffer, self.param_count, param.shape[0]) for buffer, param in zip(self.param_buffers, new))
+        for buffer, param in zip(self.param_buffers, new) :
+            buffer[self.param_count:count] = param
+
+        self.params = tuple(buffer[:count] for buffer in self.param_buffers)
+        self.param_count = count
+        return self.params
+
+def _grow(buffer, count: int, added: int) :
+    '''Returns a buffer with room for count + added rows, doubling the capacity of a full buffer and keeping its first count rows.'''
+    if count + added <= buffer.shape[0] :
+        return buffer
+
+    grown = np.empty((max(2 * buffer.shape[0], count + added, 64),) + buffer.shape[1:])
+    grown[:count] = buffer[:count]
+    return grown
@@ -0,0 +1,701 @@
+from __future__ import annotations
+import math
+import numbers
+from . import validation
+
+# Self is only for annotations, importing typing would dominate the import time of this module
+TYPE_CHECKING = False
+if TYPE_CHECKING :
+    from typing import Self
+
+_alloc = object.__new__
+
+# Rows rotated at a time when rotating vectors in place
+_BLOCK = 4096
+
+class quat() :
+    __slots__ = ('w', 'x', 'y', 'z')
+
+    def __init__(self, q = [1, 0, 0, 0]) :
+        '''
+        Construct a quaternion.
+
+        Args
+        ---
+        q : array_like, opt.
+            Scalar first quaternion q(w, x, y, z)
+        '''
+        self.w = float(q[0])
+        self.x = float(q[1])
+        self.y = float(q[2])
+        self.z = float(q[3])
+
+    def _new(w: float, x: float, y: float, z: float) :
+        '''
+        Constructs a quaternion directly from its four float components.
+
+        Used internally by arithmetic to skip the indexing and conversions in __init__.
+        '''
+        q = _alloc(quat)
+        q.w = w
+        q.x = x
+        q.y = y
+        q.z = z
+        return q
+    
+    def norm(self) :
+        '''
+        Returns the 2 norm of the quaternion.
+        '''
+        return math.sqrt(self.sum_sq(self))
+    
+    def normalized(self) :
+        '''
+        Returns the normalized quaternion.
+        '''
+        norm = self.norm()
+
+        return quat._new(
+            self.w / norm,
+            self.x / norm,
+            self.y / norm,
+            self.z / norm
+        )
+
+    def normalize_(self) :
+        '''
+        Normalizes the quaternion in place and returns it.
+        '''
+        norm = self.norm()
+
+        self.w /= norm
+        self.x /= norm
+        self.y /= norm
+        self.z /= norm
+        return self
+
+    def copy(self) :
+        '''
+        Returns a copy of the quaternion.
+        '''
+        return quat._new(self.w, self.x, self.y, self.z)
+
+    def conj(self) :
+        '''
+        Returns the conjugate of the quaternion.
+        
+        For unit quaternions, this is the inverse, and for unit quaternions representing rotations, it is the inverse rotation.
+        '''
+        return quat._new(
+            self.w,
+            -self.x,
+            -self.y,
+            -self.z
+        )
+    
+    def inv(self) :
+        '''
+        Returns the inverse of the quaternion.
+        
+        Note: this is equivelant to the conjugate only for unit quaternions.
+        '''
+        return self.conj() / self.sum_sq(self)
+    
+    def rot_apply(self, vec, check: bool = None) :
+        '''
+        Applies the quaternion as a rotation to the vector.
+        
+        Args
+        ---
+        vec : array_like
+            A vector in R^3 to apply the rotation to
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        vec_rot : list
+            Original vector rotated by the quaternion
+        '''
+        if validation.should_check(check) and not self.is_unit() :
+            raise ArithmeticError('Only unit quaternions are valid representations of rotations')
+        
+        vec_rot = self * quat([0, *vec]) * self.conj()
+
+        return [
+            vec_rot.x,
+            vec_rot.y,
+            vec_rot.z
+        ]
+    
+    def rot_apply_many(self, points, out = None, check: bool = None) :
+        '''
+        Applies the quaternion as a rotation to many vectors at once.
+
+        The rotation is converted to a 3x3 matrix once and applied with a single matrix multiply.
+
+        Args
+        ---
+        points : array_like
+            (N, 3) vectors in R^3 to apply the rotation to
+        out : ndarray, opt.
+            (N, 3) float64 array to write the rotated vectors into, may be points itself
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        points_rot : ndarray
+            (N, 3) vectors rotated by the quaternion
+        '''
+        import numpy as np
+
+        rot = self.as_matrix(check)
+
+        points = np.asarray(points, dtype=np.float64)
+        if out is None or out.ctypes.data != points.ctypes.data or out.strides != points.strides :
+            return np.matmul(points, rot.T, out=out)
+
+        # matmul copies an input which overlaps its output, so rotate in place a block at a time through a small buffer
+        buf = np.empty((min(_BLOCK, points.shape[0]), 3))
+        for start in range(0, points.shape[0], _BLOCK) :
+            block = out[start:start + _BLOCK]
+            np.matmul(block, rot.T, out=buf[:block.shape[0]])
+            block[...] = buf[:block.shape[0]]
+
+        return out
+
+    def as_matrix(self, check: bool = None) :
+        '''
+        Returns the 3x3 rotation matrix represented by a unit quaternion.
+
+        Args
+        ---
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        rot : ndarray
+            (3, 3) rotation matrix
+        '''
+        import numpy as np
+
+        if validation.should_check(check) and not self.is_unit() :
+            raise ArithmeticError('Only unit quaternions are valid representations of rotations')
+
+        w, x, y, z = self.w, self.x, self.y, self.z
+        return np.array([
+            [1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)],
+            [2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)],
+            [2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)]
+        ])
+
+    def from_matrix(rot) :
+        '''
+        Constructs a unit quaternion from a 3x3 rotation matrix using Shepperd's method.
+
+        Args
+        ---
+        rot : array_like
+            (3, 3) rotation matrix
+        '''
+        from .quat_array import quat_array
+
+        return quat_array.from_matrix([rot])[0]
+
+    def from_euler(seq: str, angles: list[float], degrees: bool = False) :
+        '''
+        Constructs a unit quaternion from Euler angles.
+
+        Args
+        ---
+        seq : str
+            Three axes from ['x', 'y', 'z'] giving the sequence of rotations, lower case for extrinsic (fixed axes) rotations or upper case for intrinsic (rotating axes) rotations, e.g. 'xyz' or 'ZYX'
+        angles : list[float]
+            The angles of the rotations about each axis of the sequence in order
+        degrees : bool, opt.
+            Whether the angles are given in degrees rather than radians
+        '''
+        from .quat_array import quat_array
+
+        return quat_array.from_euler(seq, [angles], degrees)[0]
+
+    def as_euler(self, seq: str, degrees: bool = False, check: bool = None) :
+        '''
+        Returns the Euler angles of a unit quaternion.
+
+        Args
+        ---
+        seq : str
+            Three axes from ['x', 'y', 'z'] giving the sequence of rotations, lower case for extrinsic (fixed axes) rotations or upper case for intrinsic (rotating axes) rotations, e.g. 'xyz' or 'ZYX'
+        degrees : bool, opt.
+            Whether to return the angles in degrees rather than radians
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        angles : list[float]
+            The angles of the rotations about each axis of the sequence in order
+        '''
+        from .quat_array import quat_array
+
+        return quat_array(self).as_euler(seq, degrees, check)[0].tolist()
+
+    def from_axis(theta: float, u: list[float]) :
+        '''
+        Constructs a unit quaternion from the axis angle representation.
+
+        q = cos(theta/2) + u sin(theta/2)
+
+        Args
+        ---
+        theta : float
+            The angle of the rotation in radians between 0 and pi
+        u : list[float]
+            Unit vector representing the angle the rotation is about
+        '''
+        theta = theta / 2
+        coef = math.sin(theta) / math.sqrt(u[0] ** 2 + u[1] ** 2 + u[2] ** 2)
+        return quat._new(math.cos(theta), u[0] * coef, u[1] * coef, u[2] * coef)
+
+    def as_axis(self, check: bool = None) :
+        '''
+        Returns the axis angle representation of a unit quaternion.
+
+        q = cos(theta/2) + u sin(theta/2)
+
+        Args
+        ---
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        theta : float
+            The angle of the rotation in radians between 0 and pi
+        u : list[float]
+            Unit vector representing the angle the rotation is about
+        '''
+        if validation.should_check(check) and not self.is_unit() :
+            raise ArithmeticError('Only unit quaternions are valid representations of rotations')
+        
+        if abs(self.w - 1) <= 1e-9 :
+            return 0, [0, 0, 0]
+        
+        theta = math.acos(self.w)
+        coef = math.sin(theta)
+        return 2 * theta, [self.x / coef, self.y / coef, self.z / coef]
+
+    def exp(self) :
+        '''
+        Returns the quaternion exponential.
+
+        exp(w + v) = e^w (cos|v| + v sin|v| / |v|)
+
+        The exponential of a pure quaternion (0, theta/2 u) is the unit quaternion rotating by theta about u.
+        '''
+        phi = math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+        scale = math.exp(self.w)
+        coef = scale * _sinc(phi)
+        return quat._new(scale * math.cos(phi), coef * self.x, coef * self.y, coef * self.z)
+
+    def log(self) :
+        '''
+        Returns the quaternion logarithm, the inverse of exp.
+
+        log(q) = ln|q| + v atan2(|v|, w) / |v|
+
+        The logarithm of a unit quaternion is the pure quaternion (0, theta/2 u) of its rotation, with theta between 0 and 2 pi.
+        '''
+        w = self.w
+        s_sq = self.x * self.x + self.y * self.y + self.z * self.z
+        s = math.sqrt(s_sq)
+        norm = math.log(math.sqrt(w * w + s_sq))
+
+        if s <= 1e-8 and w > 0 :
+            # Taylor series of atan(s / w) / s
+            coef = (1 - s_sq / (3 * w * w)) / w
+        elif s == 0 :
+            # Any axis represents a half turn of the quaternion, so use the x axis
+            return quat._new(norm, math.pi, 0.0, 0.0)
+        else :
+            coef = math.atan2(s, w) / s
+
+        return quat._new(norm, coef * self.x, coef * self.y, coef * self.z)
+
+    def integrate(self, omega: list[float], dt: float) :
+        '''
+        Integrates a constant angular velocity over a time step, exactly rather than by Euler steps.
+
+        q(t + dt) = q(t) exp(omega dt / 2)
+
+        Args
+        ---
+        omega : list[float]
+            Angular velocity in radians per unit time, in the frame of the rotation
+        dt : float
+            The time step
+
+        Returns
+        ---
+        q : quat
+            The rotation after the time step
+        '''
+        half = dt / 2
+        return self * quat._new(0.0, omega[0] * half, omega[1] * half, omega[2] * half).exp()
+
+        
+    def is_pure(self) :
+        '''Check if this is a pure quaternion.'''
+        return True if self.w == 0 else False
+    
+    def is_unit(self) :
+        '''Check if this is a unit quaternion.'''
+        return True if abs(self.norm() - 1) <= 1e-9 else False
+    
+    def is_orth(self, p: Self) :
+        '''Check if this quaternion is orthogonal to the quaternion p.'''
+        return True if self.sum_sq(p) <= 1e-9 else False
+    
+    def sum_sq(self, p: Self) :
+        '''Returns the sum of the squares of the elements of two quaternions.'''
+        return self.w * p.w + self.x * p.x + self.y * p.y + self.z * p.z
+    
+    def slerp(self, stop: Self, tau: float, check: bool = None) :
+        '''
+        Perform Spherical Linear Interpolation (SLERP) from the current unit quaternion to another.
+
+        Kavan and Žára, 2005, Spherical blend skinning: a real-time deformation of articulated models (https://doi.org/10.1145/1053427.1053429)
+        
+        Args
+        ---
+        stop : quat
+            The unit quaternion to perform interpolation to from this one
+        tau : float
+            A value between 0 and 1 representing how far along the interpolation to retrun a value for
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        q : quat
+            A unit quaternion interpolated between self and stop
+        '''
+        if validation.should_check(check) and not (self.is_unit() and stop.is_unit()) :
+            raise BaseException('Only unit quaternions are valid representations of rotations')
+        elif not (tau >= 0 and tau <= 1) :
+            raise BaseException(f'The value of tau {tau} must be in [0,1]')
+
+        dot = self.sum_sq(stop)
+        if dot >= 0 :
+            start = self
+            if dot > 1 :
+                dot = 1
+        else :
+            start = -1 * self
+            dot *= -1
+            if dot < -1 :
+                dot = -1
+
+        theta = math.acos(dot)
+
+        if theta == 0 or theta == math.pi :
+            return start.copy()
+        
+        return ((math.sin((1 - tau) * theta) * start) + (math.sin(tau * theta) * stop)) / math.sin(theta)
+    
+    def slerp_n(self, stop: Self, n: int, check: bool = None) :
+        '''
+        Returns n equally spaced unit quaternions interpolated between self and stop using SLERP.
+
+        Args
+        ---
+        stop : quat
+            Unit quaternion to interpolate to
+        n : int
+            Number of interpolated quaternions to return
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        qs : quat_array
+        '''
+        if n > 0 :
+            d_tau = 1 / (n + 1)
+        else :
+            raise ZeroDivisionError
+
+        return self.slerp_many(stop, [(i + 1) * d_tau for i in range(n)], check)
+
+    def slerp_many(self, stop: Self, taus, check: bool = None) :
+        '''
+        Returns unit quaternions interpolated between self and stop using SLERP at each value of tau.
+
+        The angle between the quaternions is only computed once, so this is much faster than repeated calls to slerp.
+
+        Args
+        ---
+        stop : quat
+            Unit quaternion to interpolate to
+        taus : array_like
+            Values between 0 and 1 representing how far along the interpolation to return values for
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        qs : quat_array
+        '''
+        from .quat_array import quat_array
+
+        return quat_array(self).slerp(stop, taus, check)
+
+    def qlerp(self, stop: Self, tau: float, check: bool = None) :
+        '''
+        Perform Quaternion Linear Interpolation (QLERP) from the current unit quaternion to another.
+
+        Faster than SLERP, but not guarenteed to be the shortest path.
+
+        Kavan and Žára, 2005, Spherical blend skinning: a real-time deformation of articulated models (https://doi.org/10.1145/1053427.1053429)
+        
+        Args
+        ---
+        stop : quat
+            The unit quaternion to perform interpolation to from this one
+        tau : float
+            A value between 0 and 1 representing how far along the interpolation to retrun a value for
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        q : quat
+            A unit quaternion interpolated between self and stop
+        '''
+        if validation.should_check(check) and not (self.is_unit() and stop.is_unit()) :
+            raise BaseException('Only unit quaternions are valid representations of rotations')
+        elif not (tau >= 0 and tau <= 1) :
+            raise BaseException(f'The value of tau {tau} must be in [0,1]')
+        
+        if self.sum_sq(stop) >= 0 :
+            start = self
+        else :
+            start = -1 * self
+
+        interp = (1 - tau) * start + tau * stop
+
+        return interp / interp.norm()
+
+    def qlerp_n(self, stop: Self, n: int, check: bool = None) :
+        '''
+        Returns n equally spaced unit quaternions interpolated between self and stop using QLERP.
+
+        Args
+        ---
+        stop : quat
+            Unit quaternion to interpolate to
+        n : int
+            Number of interpolated quaternions to return
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        qs : quat_array
+        '''
+        if n > 0 :
+            d_tau = 1 / (n + 1)
+        else :
+            raise ZeroDivisionError
+
+        return self.qlerp_many(stop, [(i + 1) * d_tau for i in range(n)], check)
+
+    def qlerp_many(self, stop: Self, taus, check: bool = None) :
+        '''
+        Returns unit quaternions interpolated between self and stop using QLERP at each value of tau.
+
+        The sign flip is only computed once, so this is much faster than repeated calls to qlerp.
+
+        Args
+        ---
+        stop : quat
+            Unit quaternion to interpolate to
+        taus : array_like
+            Values between 0 and 1 representing how far along the interpolation to return values for
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        qs : quat_array
+        '''
+        from .quat_array import quat_array
+
+        return quat_array(self).qlerp(stop, taus, check)
+
+    def __mul__(self, p: Self) :
+        '''
+        Quaternion multiplication.  Multiplies self * p.  Assumes scalar first notation q(w, x, y, z).
+
+        Args
+        ---
+        self : quat
+            Left side quaternion
+        p : quat or float
+            Right side quaternion, or a real scalar to scale by
+
+        Returns
+        ---
+        q2 : ndarray
+            self.q * p
+        '''
+        if _scalar(p) :
+            return quat.__rmul__(self, p)
+        elif not isinstance(p, quat) :
+            return NotImplemented
+
+        w, x, y, z = self.w, self.x, self.y, self.z
+        pw, px, py, pz = p.w, p.x, p.y, p.z
+
+        return quat._new(
+            w * pw - x * px - y * py - z * pz,
+            w * px + x * pw + y * pz - z * py,
+            w * py - x * pz + y * pw + z * px,
+            w * pz + x * py - y * px + z * pw
+        )
+
+    def mul_into(a: Self, b: Self, out: Self) :
+        '''
+        Quaternion multiplication a * b written into an existing quaternion without allocating a new one.
+
+        Args
+        ---
+        a : quat
+            Left side quaternion
+        b : quat
+            Right side quaternion
+        out : quat
+            The quaternion to overwrite with the product, may be a or b
+
+        Returns
+        ---
+        out : quat
+        '''
+        w, x, y, z = a.w, a.x, a.y, a.z
+        pw, px, py, pz = b.w, b.x, b.y, b.z
+
+        out.w = w * pw - x * px - y * py - z * pz
+        out.x = w * px + x * pw + y * pz - z * py
+        out.y = w * py - x * pz + y * pw + z * px
+        out.z = w * pz + x * py - y * px + z * pw
+        return out
+
+    def __rmul__(self, p) :
+        '''Non-quaternion multiplication by a scalar.'''
+        if not _scalar(p) :
+            return NotImplemented
+
+        p = float(p)
+        return quat._new(
+            self.w * p,
+            self.x * p,
+            self.y * p,
+            self.z * p
+        )
+    
+    def __add__(self, p: Self) :
+        '''Quaternion addition.'''
+        if not isinstance(p, quat) :
+            return NotImplemented
+
+        return quat._new(
+            self.w + p.w,
+            self.x + p.x,
+            self.y + p.y,
+            self.z + p.z
+        )
+    
+    def __truediv__(self, p) :
+        '''Scalar division.'''
+        if not _scalar(p) :
+            return NotImplemented
+
+        p = float(p)
+        return quat._new(
+            self.w / p,
+            self.x / p,
+            self.y / p,
+            self.z / p
+        )
+
+    def __imul__(self, p) :
+        '''In place quaternion multiplication self * p, or multiplication by a scalar.'''
+        if isinstance(p, quat) :
+            return quat.mul_into(self, p, self)
+        elif not _scalar(p) :
+            return NotImplemented
+
+        p = float(p)
+        self.w *= p
+        self.x *= p
+        self.y *= p
+        self.z *= p
+        return self
+
+    def __iadd__(self, p: Self) :
+        '''In place quaternion addition.'''
+        if not isinstance(p, quat) :
+            return NotImplemented
+
+        self.w += p.w
+        self.x += p.x
+        self.y += p.y
+        self.z += p.z
+        return self
+
+    def __itruediv__(self, p) :
+        '''In place scalar division.'''
+        if not _scalar(p) :
+            return NotImplemented
+
+        p = float(p)
+        self.w /= p
+        self.x /= p
+        self.y /= p
+        self.z /= p
+        return self
+    
+    def __eq__(self, p):
+        if type(p) == quat :
+            return (self.w, self.x, self.y, self.z) == (p.w, p.x, p.y, p.z)
+        else :
+            return NotImplemented
+
+    def __hash__(self) :
+        '''
+        Hash of the components, so quaternions may be used as dict keys.
+
+        Quaternions used as keys must not be modified afterwards.
+        '''
+        return hash((self.w, self.x, self.y, self.z))
+        
+    def __pow__(self, p) :
+        '''Quaternion raised to the power p, exp(p log(q)).'''
+        log = self.log()
+        return quat._new(p * log.w, p * log.x, p * log.y, p * log.z).exp()
+
+    def __str__(self):
+        return f'w: {self.w}, x: {self.x}, y: {self.y}, z: {self.z}'
+
+def _scalar(p) :
+    '''Whether p is a real scalar, including NumPy scalars, which quaternions may be multiplied or divided by.'''
+    return isinstance(p, numbers.Real)
+
+def _sinc(phi: float) :
+    '''Returns sin(phi) / phi, using its Taylor series near 0.'''
+    if phi < 1e-4 :
+        return 1 - phi * phi / 6
+    return math.sin(phi) / phi
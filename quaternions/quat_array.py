@@ -0,0 +1,707 @@
+from .quat import quat
+from . import validation
+import numpy as np
+
+def qmul(a, b, out = None) :
+    '''
+    Batched quaternion multiplication a * b along the last axis.  Assumes scalar first notation q(w, x, y, z).
+
+    Leading dimensions are broadcast against each other, so one quaternion may be multiplied against many.
+
+    Args
+    ---
+    a : ndarray
+        (..., 4) left side quaternions
+    b : ndarray
+        (..., 4) right side quaternions
+    out : ndarray, opt.
+        Array to write the result into, may be a or b
+
+    Returns
+    ---
+    out : ndarray
+        (..., 4) products a * b
+    '''
+    aw, ax, ay, az = a[..., 0], a[..., 1], a[..., 2], a[..., 3]
+    bw, bx, by, bz = b[..., 0], b[..., 1], b[..., 2], b[..., 3]
+
+    w = aw * bw - ax * bx - ay * by - az * bz
+    x = aw * bx + ax * bw + ay * bz - az * by
+    y = aw * by - ax * bz + ay * bw + az * bx
+    z = aw * bz + ax * by - ay * bx + az * bw
+
+    if out is None :
+        out = np.empty(np.broadcast_shapes(a.shape, b.shape))
+
+    out[..., 0] = w
+    out[..., 1] = x
+    out[..., 2] = y
+    out[..., 3] = z
+
+    return out
+
+class quat_array() :
+    # Defer arithmetic with ndarrays to the reflected operators below
+    __array_ufunc__ = None
+
+    def __init__(self, q = [[1, 0, 0, 0]], copy: bool = True) :
+        '''
+        Construct an array of quaternions backed by a contiguous (N, 4) float64 buffer.
+
+        Args
+        ---
+        q : array_like, quat, list[quat] or quat_array, opt.
+            (N, 4) or (4,) scalar first quaternions q(w, x, y, z)
+        copy : bool, opt.
+            Whether to copy an existing array or container, by default True so the new array never shares memory with the one given
+        '''
+        if isinstance(q, quat_array) :
+            q = q.q
+        elif isinstance(q, quat) :
+            q = [(q.w, q.x, q.y, q.z)]
+        elif isinstance(q, list) and len(q) > 0 and isinstance(q[0], quat) :
+            q = [(p.w, p.x, p.y, p.z) for p in q]
+
+        q = np.array(q, dtype=np.float64, order='C') if copy else np.ascontiguousarray(q, dtype=np.float64)
+        if q.ndim == 1 and q.shape[0] == 4 :
+            q = q.reshape(1, 4)
+        elif q.ndim == 1 and q.shape[0] == 0 :
+            q = q.reshape(0, 4)
+        elif q.ndim != 2 or q.shape[1] != 4 :
+            raise ValueError(f'Expected an (N, 4) array of quaternions, got shape {q.shape}')
+
+        self.q = q
+
+    def from_quats(qs: list[quat]) :
+        '''
+        Constructs a quaternion array from a list of quaternions.
+
+        Args
+        ---
+        qs : list[quat]
+            The quaternions to store
+        '''
+        return quat_array(list(qs))
+
+    def as_quats(self) :
+        '''
+        Returns the quaternion array as a list of quaternions.
+
+        Returns
+        ---
+        qs : list[quat]
+        '''
+        return [quat._new(*row) for row in self.q.tolist()]
+
+    @property
+    def w(self) :
+        return self.q[:, 0]
+
+    @property
+    def x(self) :
+        return self.q[:, 1]
+
+    @property
+    def y(self) :
+        return self.q[:, 2]
+
+    @property
+    def z(self) :
+        return self.q[:, 3]
+
+    def norm(self) :
+        '''
+        Returns the 2 norm of each quaternion as an (N,) array.
+        '''
+        return np.sqrt(self.sum_sq(self))
+
+    def normalized(self) :
+        '''
+        Returns the normalized quaternions.
+        '''
+        return quat_array(self.q / self.norm()[:, None], copy=False)
+
+    def normalize_(self) :
+        '''
+        Normalizes the quaternions in place and returns them.
+        '''
+        self.q /= self.norm()[:, None]
+        return self
+
+    def conj(self) :
+        '''
+        Returns the conjugate of each quaternion.
+
+        For unit quaternions, this is the inverse, and for unit quaternions representing rotations, it is the inverse rotation.
+        '''
+        q = self.q.copy()
+        q[:, 1:] *= -1
+        return quat_array(q, copy=False)
+
+    def inv(self) :
+        '''
+        Returns the inverse of each quaternion.
+
+        Note: this is equivelant to the conjugate only for unit quaternions.
+        '''
+        q = self.conj().q
+        q /= self.sum_sq(self)[:, None]
+        return quat_array(q, copy=False)
+
+    def rot_apply(self, vecs, check: bool = None) :
+        '''
+        Applies each quaternion as a rotation to the corresponding vector.
+
+        Args
+        ---
+        vecs : array_like
+            (N, 3) vectors in R^3 to apply the rotations to, or a single (3,) vector to rotate by every quaternion
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        vecs_rot : ndarray
+            (N, 3) vectors rotated by the quaternions
+        '''
+        if validation.should_check(check) and not np.all(self.is_unit()) :
+            raise ArithmeticError('Only unit quaternions are valid representations of rotations')
+
+        vecs = np.asarray(vecs, dtype=np.float64)
+        w = self.q[:, 0:1]
+        u = self.q[:, 1:]
+
+        # v' = v + 2w (u x v) + 2 u x (u x v)
+        t = 2 * np.cross(u, vecs)
+        return vecs + w * t + np.cross(u, t)
+
+    def as_matrix(self, check: bool = None) :
+        '''
+        Returns the rotation matrices represented by the unit quaternions.
+
+        Args
+        ---
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        rot : ndarray
+            (N, 3, 3) rotation matrices
+        '''
+        if validation.should_check(check) and not np.all(self.is_unit()) :
+            raise ArithmeticError('Only unit quaternions are valid representations of rotations')
+
+        w, x, y, z = self.q.T
+        rot = np.empty((len(self), 3, 3))
+        rot[:, 0, 0] = 1 - 2 * (y * y + z * z)
+        rot[:, 0, 1] = 2 * (x * y - w * z)
+        rot[:, 0, 2] = 2 * (x * z + w * y)
+        rot[:, 1, 0] = 2 * (x * y + w * z)
+        rot[:, 1, 1] = 1 - 2 * (x * x + z * z)
+        rot[:, 1, 2] = 2 * (y * z - w * x)
+        rot[:, 2, 0] = 2 * (x * z - w * y)
+        rot[:, 2, 1] = 2 * (y * z + w * x)
+        rot[:, 2, 2] = 1 - 2 * (x * x + y * y)
+        return rot
+
+    def from_matrix(rot) :
+        '''
+        Constructs unit quaternions from rotation matrices using Shepperd's method.
+
+        Every candidate solution is computed for the whole batch and the best conditioned one is selected per matrix, so there is no branching across the batch.
+
+        Shepperd, 1978, Quaternion from rotation matrix (https://doi.org/10.2514/3.55767b)
+
+        Args
+        ---
+        rot : array_like
+            (N, 3, 3) rotation matrices
+        '''
+        rot = np.asarray(rot, dtype=np.float64)
+        m00, m01, m02 = rot[:, 0, 0], rot[:, 0, 1], rot[:, 0, 2]
+        m10, m11, m12 = rot[:, 1, 0], rot[:, 1, 1], rot[:, 1, 2]
+        m20, m21, m22 = rot[:, 2, 0], rot[:, 2, 1], rot[:, 2, 2]
+        trace = m00 + m11 + m22
+
+        # One candidate per row, each stable when its leading component is the largest
+        cand = np.empty((rot.shape[0], 4, 4))
+        cand[:, 0] = np.stack([1 + trace, m21 - m12, m02 - m20, m10 - m01], axis=-1)
+        cand[:, 1] = np.stack([m21 - m12, 1 + m00 - m11 - m22, m10 + m01, m02 + m20], axis=-1)
+        cand[:, 2] = np.stack([m02 - m20, m10 + m01, 1 - m00 + m11 - m22, m21 + m12], axis=-1)
+        cand[:, 3] = np.stack([m10 - m01, m02 + m20, m21 + m12, 1 - m00 - m11 + m22], axis=-1)
+
+        choice = np.argmax(np.stack([trace, m00, m11, m22], axis=-1), axis=-1)
+        q = np.take_along_axis(cand, choice[:, None, None], axis=1)[:, 0]
+
+        return quat_array(q / np.linalg.norm(q, axis=-1, keepdims=True), copy=False)
+
+    def from_euler(seq: str, angles, degrees: bool = False) :
+        '''
+        Constructs unit quaternions from Euler angles.
+
+        Args
+        ---
+        seq : str
+            Three axes from ['x', 'y', 'z'] giving the sequence of rotations, lower case for extrinsic (fixed axes) rotations or upper case for intrinsic (rotating axes) rotations, e.g. 'xyz' or 'ZYX'
+        angles : array_like
+            (N, 3) angles of the rotations about each axis of the sequence in order
+        degrees : bool, opt.
+            Whether the angles are given in degrees rather than radians
+        '''
+        extrinsic = _euler_seq(seq)
+        angles = np.asarray(angles, dtype=np.float64).reshape(-1, 3)
+        if degrees :
+            angles = np.deg2rad(angles)
+
+        half = angles / 2
+        elem = np.zeros((3,) + angles.shape[:1] + (4,))
+        for idx, axis in enumerate(seq.lower()) :
+            elem[idx, :, 0] = np.cos(half[:, idx])
+            elem[idx, :, 1 + 'xyz'.index(axis)] = np.sin(half[:, idx])
+
+        # Extrinsic rotations are applied about the fixed axes, so later rotations multiply on the left
+        if extrinsic :
+            q = qmul(elem[2], qmul(elem[1], elem[0]))
+        else :
+            q = qmul(qmul(elem[0], elem[1]), elem[2])
+
+        return quat_array(q, copy=False)
+
+    def as_euler(self, seq: str, degrees: bool = False, check: bool = None) :
+        '''
+        Returns the Euler angles of the unit quaternions.
+
+        Gimbal lock is detected per quaternion, in which case the third angle is set to zero and the first angle holds the full rotation about the aligned axes.
+
+        Bernardes and Viollet, 2022, Quaternion to Euler angles conversion: A direct, general and computationally efficient method (https://doi.org/10.1371/journal.pone.0276302)
+
+        Args
+        ---
+        seq : str
+            Three axes from ['x', 'y', 'z'] giving the sequence of rotations, lower case for extrinsic (fixed axes) rotations or upper case for intrinsic (rotating axes) rotations, e.g. 'xyz' or 'ZYX'
+        degrees : bool, opt.
+            Whether to return the angles in degrees rather than radians
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        angles : ndarray
+            (N, 3) angles of the rotations about each axis of the sequence in order
+        '''
+        if validation.should_check(check) and not np.all(self.is_unit()) :
+            raise ArithmeticError('Only unit quaternions are valid representations of rotations')
+
+        extrinsic = _euler_seq(seq)
+        seq = seq.lower()
+        if not extrinsic :
+            seq = seq[::-1]
+
+        i, j, k = ('xyz'.index(axis) for axis in seq)
+        symmetric = i == k
+        if symmetric :
+            k = 3 - i - j
+        sign = (i - j) * (j - k) * (k - i) // 2
+
+        w, qi, qj, qk = self.q[:, 0], self.q[:, 1 + i], self.q[:, 1 + j], self.q[:, 1 + k] * sign
+        if symmetric :
+            a, b, c, d = w, qi, qj, qk
+        else :
+            a, b, c, d = w - qj, qi + qk, qj + w, qk - qi
+
+        angles = np.empty((len(self), 3))
+        angles[:, 1] = 2 * np.arctan2(np.hypot(c, d), np.hypot(a, b))
+
+        half_sum = np.arctan2(b, a)
+        half_diff = np.arctan2(d, c)
+
+        first, third = (0, 2) if extrinsic else (2, 0)
+        angles[:, first] = half_sum - half_diff
+        angles[:, third] = half_sum + half_diff
+
+        # Gimbal lock when the middle angle is 0 or pi, only the first angle is then determined
+        lock_zero = np.abs(angles[:, 1]) <= 1e-7
+        lock_pi = np.abs(angles[:, 1] - np.pi) <= 1e-7
+        angles[:, 2] = np.where(lock_zero | lock_pi, 0, angles[:, 2])
+        angles[:, 0] = np.where(lock_zero, 2 * half_sum, angles[:, 0])
+        angles[:, 0] = np.where(lock_pi, (-2 if extrinsic else 2) * half_diff, angles[:, 0])
+
+        if not symmetric :
+            angles[:, third] *= sign
+            angles[:, 1] -= np.pi / 2
+
+        angles = np.where(angles < -np.pi, angles + 2 * np.pi, angles)
+        angles = np.where(angles > np.pi, angles - 2 * np.pi, angles)
+
+        return np.rad2deg(angles) if degrees else angles
+
+    def from_axis(theta, u) :
+        '''
+        Constructs unit quaternions from the axis angle representation.
+
+        q = cos(theta/2) + u sin(theta/2)
+
+        Args
+        ---
+        theta : array_like
+            (N,) angles of the rotations in radians between 0 and pi
+        u : array_like
+            (N, 3) unit vectors representing the axes the rotations are about
+        '''
+        theta = np.asarray(theta, dtype=np.float64) / 2
+        u = np.asarray(u, dtype=np.float64)
+        coef = np.sin(theta) / np.linalg.norm(u, axis=-1)
+
+        q = np.empty(np.broadcast_shapes(theta.shape + (4,), u.shape[:-1] + (4,)))
+        q[..., 0] = np.cos(theta)
+        q[..., 1:] = u * coef[..., None]
+        return quat_array(q, copy=False)
+
+    def as_axis(self, check: bool = None) :
+        '''
+        Returns the axis angle representation of each unit quaternion.
+
+        q = cos(theta/2) + u sin(theta/2)
+
+        Args
+        ---
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        theta : ndarray
+            (N,) angles of the rotations in radians between 0 and pi
+        u : ndarray
+            (N, 3) unit vectors representing the axes the rotations are about
+        '''
+        if validation.should_check(check) and not np.all(self.is_unit()) :
+            raise ArithmeticError('Only unit quaternions are valid representations of rotations')
+
+        ident = np.abs(self.q[:, 0] - 1) <= 1e-9
+        theta = np.arccos(np.clip(self.q[:, 0], -1, 1))
+        coef = np.where(ident, 1, np.sin(theta))
+        u = np.where(ident[:, None], 0, self.q[:, 1:] / coef[:, None])
+
+        return np.where(ident, 0, 2 * theta), u
+
+    def exp(self) :
+        '''
+        Returns the exponential of each quaternion.
+
+        exp(w + v) = e^w (cos|v| + v sin|v| / |v|)
+        '''
+        phi = np.linalg.norm(self.q[:, 1:], axis=1)
+        scale = np.exp(self.q[:, 0])
+
+        out = np.empty_like(self.q)
+        out[:, 0] = scale * np.cos(phi)
+        out[:, 1:] = (scale * _sinc(phi))[:, None] * self.q[:, 1:]
+        return quat_array(out, copy=False)
+
+    def log(self) :
+        '''
+        Returns the logarithm of each quaternion, the inverse of exp.
+
+        log(q) = ln|q| + v atan2(|v|, w) / |v|
+        '''
+        w = self.q[:, 0]
+        s_sq = np.einsum('ij,ij->i', self.q[:, 1:], self.q[:, 1:])
+        s = np.sqrt(s_sq)
+
+        # Taylor series of atan(s / w) / s near the identity, elsewhere the closed form
+        small = (s <= 1e-8) & (w > 0)
+        safe_w = np.where(small, w, 1)
+        coef = np.where(small, (1 - s_sq / (3 * safe_w * safe_w)) / safe_w, np.arctan2(s, w) / np.where(s > 0, s, 1))
+
+        out = np.empty_like(self.q)
+        out[:, 0] = np.log(np.sqrt(w * w + s_sq))
+        out[:, 1:] = coef[:, None] * self.q[:, 1:]
+
+        # Any axis represents a half turn of the quaternion, so use the x axis
+        out[(s == 0) & (w <= 0), 1] = np.pi
+        return quat_array(out, copy=False)
+
+    def integrate(self, omega, dt) :
+        '''
+        Integrates constant angular velocities over a time step, exactly rather than by Euler steps.
+
+        q(t + dt) = q(t) exp(omega dt / 2)
+
+        Args
+        ---
+        omega : array_like
+            (N, 3) angular velocities in radians per unit time, in the frame of each rotation, or a single (3,) velocity
+        dt : float or array_like
+            The time step, or (N,) time steps
+
+        Returns
+        ---
+        qs : quat_array
+            The rotations after the time step
+        '''
+        half = np.asarray(omega, dtype=np.float64) * (_as_scale(dt) / 2)
+        step = np.zeros(half.shape[:-1] + (4,))
+        step[..., 1:] = half
+
+        return quat_array(qmul(self.q, quat_array(step, copy=False).exp().q), copy=False)
+
+    def is_pure(self) :
+        '''Returns a mask of which quaternions are pure.'''
+        return self.q[:, 0] == 0
+
+    def is_unit(self) :
+        '''Returns a mask of which quaternions are unit quaternions.'''
+        return np.abs(self.norm() - 1) <= 1e-9
+
+    def is_orth(self, p) :
+        '''Returns a mask of which quaternions are orthogonal to the quaternions p.'''
+        return np.abs(self.sum_sq(p)) <= 1e-9
+
+    def sum_sq(self, p) :
+        '''Returns the sum of the squares of the elements of the quaternions with the quaternions p as an (N,) array.'''
+        return np.einsum('ij,ij->i', *np.broadcast_arrays(self.q, _as_array(p)))
+
+    def slerp(self, stop, tau, check: bool = None) :
+        '''
+        Perform Spherical Linear Interpolation (SLERP) from each unit quaternion to the corresponding stop quaternion.
+
+        The angle and sign flip are computed once per pair of quaternions, so one pair may be sampled at many values of tau in a single pass.
+
+        Kavan and Žára, 2005, Spherical blend skinning: a real-time deformation of articulated models (https://doi.org/10.1145/1053427.1053429)
+
+        Args
+        ---
+        stop : quat, quat_array or array_like
+            The unit quaternions to perform interpolation to
+        tau : float or array_like
+            Values between 0 and 1 representing how far along the interpolation to return values for, broadcast against the quaternions
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        qs : quat_array
+            Unit quaternions interpolated between self and stop
+        '''
+        start, stop, tau = self._interp_args(stop, tau, check)
+
+        dot = np.einsum('...i,...i->...', start, stop)
+        sign = np.where(dot >= 0, 1.0, -1.0)
+        theta = np.arccos(np.minimum(np.abs(dot), 1))
+        sin_theta = np.sin(theta)
+
+        # Fall back to linear weights where the endpoints coincide
+        close = sin_theta <= 1e-12
+        sin_theta = np.where(close, 1, sin_theta)
+        c_start = np.where(close, 1 - tau, np.sin((1 - tau) * theta) / sin_theta) * sign
+        c_stop = np.where(close, tau, np.sin(tau * theta) / sin_theta)
+
+        return quat_array(c_start[..., None] * start + c_stop[..., None] * stop, copy=False)
+
+    def qlerp(self, stop, tau, check: bool = None) :
+        '''
+        Perform Quaternion Linear Interpolation (QLERP) from each unit quaternion to the corresponding stop quaternion.
+
+        Faster than SLERP, but not guarenteed to be the shortest path.
+
+        Kavan and Žára, 2005, Spherical blend skinning: a real-time deformation of articulated models (https://doi.org/10.1145/1053427.1053429)
+
+        Args
+        ---
+        stop : quat, quat_array or array_like
+            The unit quaternions to perform interpolation to
+        tau : float or array_like
+            Values between 0 and 1 representing how far along the interpolation to return values for, broadcast against the quaternions
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        qs : quat_array
+            Unit quaternions interpolated between self and stop
+        '''
+        start, stop, tau = self._interp_args(stop, tau, check)
+
+        sign = np.where(np.einsum('...i,...i->...', start, stop) >= 0, 1.0, -1.0)
+        interp = ((1 - tau) * sign)[..., None] * start + tau[..., None] * stop
+
+        return quat_array(interp / np.linalg.norm(interp, axis=-1, keepdims=True), copy=False)
+
+    def cumprod(self, workers: int = 1, executor = None) :
+        '''
+        Returns the cumulative products of the quaternions, out[i] = self[0] * self[1] * ... * self[i].
+
+        Args
+        ---
+        workers : int, opt.
+            Number of blocks to scan in parallel, a thread pool of this size is used unless an executor is given
+        executor : concurrent.futures.Executor, opt.
+            Executor to scan the blocks with, such as a ProcessPoolExecutor
+
+        Returns
+        ---
+        qs : quat_array
+        '''
+        from .scan import cumulative_compose
+        return cumulative_compose(self, workers, executor)
+
+    def mean(self, weights = None, check: bool = None) :
+        '''
+        Returns the weighted mean of the unit quaternions.
+
+        The mean is the eigenvector with the largest eigenvalue of sum(w_i q_i q_i^T), so does not depend on the order or the sign of the quaternions.
+        Use averaging.quat_mean to average sets too large to hold in memory at once.
+
+        Args
+        ---
+        weights : array_like, opt.
+            (N,) non negative weight of each quaternion, by default 1
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        q : quat
+        '''
+        from .averaging import quat_mean
+        return quat_mean().add(self, weights, check).result()
+
+    def _interp_args(self, stop, tau, check) :
+        '''Validates and returns the start, stop and tau arrays for an interpolation.'''
+        stop = _as_array(stop)
+        tau = np.asarray(tau, dtype=np.float64)
+
+        if validation.should_check(check) and not (np.all(self.is_unit()) and np.all(np.abs(np.linalg.norm(stop, axis=-1) - 1) <= 1e-9)) :
+            raise BaseException('Only unit quaternions are valid representations of rotations')
+        elif not np.all((tau >= 0) & (tau <= 1)) :
+            raise BaseException(f'The values of tau {tau} must be in [0,1]')
+
+        start = self.q if self.q.shape[0] != 1 else self.q[0]
+        return start, stop, tau
+
+    def __len__(self) :
+        return self.q.shape[0]
+
+    def __getitem__(self, idx) :
+        '''Returns a quat for an integer index, otherwise a quat_array, which is a view for a slice as in NumPy.'''
+        if isinstance(idx, (int, np.integer)) :
+            return quat._new(*self.q[idx].tolist())
+        return quat_array(self.q[idx], copy=False)
+
+    def __setitem__(self, idx, p) :
+        self.q[idx] = _as_array(p)
+
+    def __iter__(self) :
+        for row in self.q.tolist() :
+            yield quat._new(*row)
+
+    def __mul__(self, p) :
+        '''
+        Quaternion multiplication self * p when p is a quat or quat_array, otherwise multiplication by scalars.
+
+        Args
+        ---
+        p : quat, quat_array, float or array_like
+            Right side quaternions, or a scalar or (N,) array of scalars
+
+        Returns
+        ---
+        q2 : quat_array
+        '''
+        if isinstance(p, (quat, quat_array)) :
+            return quat_array(qmul(self.q, _as_array(p)), copy=False)
+        return quat_array(self.q * _as_scale(p), copy=False)
+
+    def mul_into(a, b, out) :
+        '''
+        Quaternion multiplication a * b written into an existing quaternion array.
+
+        Args
+        ---
+        a : quat or quat_array
+            Left side quaternions
+        b : quat or quat_array
+            Right side quaternions
+        out : quat_array
+            The quaternion array to overwrite with the products, may be a or b
+
+        Returns
+        ---
+        out : quat_array
+        '''
+        qmul(_as_array(a), _as_array(b), out.q)
+        return out
+
+    def __rmul__(self, p) :
+        '''Quaternion multiplication p * self by a quat, otherwise multiplication by scalars.'''
+        if isinstance(p, quat) :
+            return quat_array(qmul(_as_array(p), self.q), copy=False)
+        return quat_array(self.q * _as_scale(p), copy=False)
+
+    def __add__(self, p) :
+        '''Quaternion addition.'''
+        return quat_array(self.q + _as_array(p), copy=False)
+
+    def __truediv__(self, p) :
+        '''Scalar division by a scalar or (N,) array of scalars.'''
+        return quat_array(self.q / _as_scale(p), copy=False)
+
+    def __imul__(self, p) :
+        '''In place quaternion multiplication self * p, or multiplication by scalars.'''
+        if isinstance(p, (quat, quat_array)) :
+            qmul(self.q, _as_array(p), self.q)
+        else :
+            self.q *= _as_scale(p)
+        return self
+
+    def __iadd__(self, p) :
+        '''In place quaternion addition.'''
+        self.q += _as_array(p)
+        return self
+
+    def __itruediv__(self, p) :
+        '''In place scalar division.'''
+        self.q /= _as_scale(p)
+        return self
+
+    def __eq__(self, p) :
+        '''Returns a mask of which quaternions are equal to p.'''
+        if isinstance(p, (quat, quat_array)) :
+            return np.all(self.q == _as_array(p), axis=-1)
+        else :
+            return NotImplemented
+
+    def __pow__(self, p) :
+        '''Quaternions raised to the power p, exp(p log(q)), where p is a scalar or (N,) array.'''
+        return quat_array(_as_scale(p) * self.log().q, copy=False).exp()
+
+    def __str__(self) :
+        return f'quat_array({len(self)}):\n{self.q}'
+
+def _euler_seq(seq: str) :
+    '''Validates an Euler angle sequence and returns whether it is extrinsic.'''
+    if len(seq) != 3 or not (seq.islower() or seq.isupper()) or any(axis not in 'xyz' for axis in seq.lower()) :
+        raise ValueError(f'Euler sequence {seq} must be three of x, y, z, all lower case (extrinsic) or all upper case (intrinsic)')
+    elif seq[0] == seq[1] or seq[1] == seq[2] :
+        raise ValueError(f'Euler sequence {seq} must not rotate about the same axis twice in a row')
+
+    return seq.islower()
+
+def _as_array(p) :
+    '''Returns the raw (N, 4) or (4,) array behind a quat, quat_array or array_like.'''
+    if isinstance(p, quat_array) :
+        return p.q
+    elif isinstance(p, quat) :
+        return np.array([p.w, p.x, p.y, p.z])
+    return np.asarray(p, dtype=np.float64)
+
+def _as_scale(p) :
+    '''Returns a scalar or (N,) array of scalars shaped to broadcast against an (N, 4) array.'''
+    p = np.asarray(p, dtype=np.float64)
+    return p[..., None] if p.ndim > 0 else p
+
+def _sinc(phi) :
+    '''Returns sin(phi) / phi elementwise, which numpy evaluates stably near 0.'''
+    return np.sinc(phi / np.pi)
@@ -0,0 +1,326 @@
+from .quat import quat
+from .quat_array import quat_array
+from . import validation
+import heapq
+import math
+import numpy as np
+
+# Most quaternions left pending, searched linearly, before they are added to the tree
+_PENDING = 4096
+# Query rows whose distances to the pending quaternions are computed at once
+_ROWS = 256
+
+class quat_index() :
+    def __init__(self, qs, leaf_size: int = 32, check: bool = None) :
+        '''
+        Spatial index of unit quaternions answering nearest orientation queries in sublinear time.
+
+        Quaternions are stored in a kd-tree over R^4.  q and -q are the same rotation, so each query searches from both q and -q.
+        The chordal distance min(|q - p|, |q + p|) = 2 sin(theta / 4) increases with the geodesic angle theta between the rotations, so the tree answers queries by angle exactly.
+
+        Args
+        ---
+        qs : quat_array, list[quat] or array_like
+            (N, 4) unit quaternions to index, identified by their position
+        leaf_size : int, opt.
+            Maximum number of quaternions in each leaf of the tree
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+        '''
+        if leaf_size < 1 :
+            raise ValueError(f'The leaf size {leaf_size} must be at least 1')
+
+        self.leaf_size = leaf_size
+
+        # Quaternions are stored in a buffer which doubles when full, points is a view of the filled rows
+        self.buffer = np.empty((0, 4))
+        self.points = self.buffer
+
+        # Quaternions from index flushed onwards are pending, they are searched linearly until they are next added to the tree
+        self.flushed = 0
+        self.built = 0
+        self.nodes = []
+
+        self.insert(qs, check)
+        if self.flushed < len(self) :
+            self.rebuild()
+
+    def __len__(self) :
+        return self.points.shape[0]
+
+    def insert(self, qs, check: bool = None) :
+        '''
+        Adds quaternions to the index, they are given the next indices in order.
+
+        New quaternions are searched linearly until a few thousand accumulate, then they are added to the leaves of the tree.
+        The whole tree is rebuilt to rebalance it once it has doubled in size since it was last built.
+
+        Args
+        ---
+        qs : quat, quat_array, list[quat] or array_like
+            (N, 4) unit quaternions to add
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+        '''
+        qs = quat_array(qs, copy=False)
+        if validation.should_check(check) and not np.all(qs.is_unit()) :
+            raise BaseException('Only unit quaternions are valid representations of rotations')
+
+        count, added = len(self), qs.q.shape[0]
+        if count + added > self.buffer.shape[0] :
+            buffer = np.empty((max(2 * self.buffer.shape[0], count + added, 64), 4))
+            buffer[:count] = self.points
+            self.buffer = buffer
+
+        # Keep the quaternions in the w >= 0 hemisphere so the tree boxes stay small
+        self.buffer[count:count + added] = np.where(qs.q[:, :1] < 0, -qs.q, qs.q)
+        self.points = self.buffer[:count + added]
+
+        if len(self) - self.flushed > max(self.leaf_size, _PENDING) :
+            if len(self) > 2 * self.built :
+                self.rebuild()
+            else :
+                self._flush()
+
+    def rebuild(self) :
+        '''Rebuilds the tree over every quaternion, including any pending insertions.'''
+        self.flushed = self.built = len(self)
+
+        # Each node is [left, right, mins, maxs, indices, points], leaves have no children and internal nodes no indices or points
+        self.nodes = []
+        if self.built > 0 :
+            self._build(np.arange(self.built))
+
+    def _build(self, idx, node: int = None) :
+        '''Builds the subtree over the quaternions idx and returns its node index, replacing an existing node if one is given.'''
+        pts = self.points[idx]
+        mins, maxs = pts.min(axis=0), pts.max(axis=0)
+
+        if node is None :
+            node = len(self.nodes)
+            self.nodes.append(None)
+
+        if idx.shape[0] <= self.leaf_size :
+            self.nodes[node] = [-1, -1, mins.tolist(), maxs.tolist(), idx, pts]
+            return node
+
+        # Split at the median of the widest dimension
+        dim = int(np.argmax(maxs - mins))
+        mid = idx.shape[0] // 2
+        order = np.argpartition(pts[:, dim], mid)
+
+        left = self._build(idx[order[:mid]])
+        right = self._build(idx[order[mid:]])
+        self.nodes[node] = [left, right, mins.tolist(), maxs.tolist(), None, None]
+        return node
+
+    def _flush(self) :
+        '''Adds the pending quaternions to the leaves of the tree.'''
+        idx = np.arange(self.flushed, len(self))
+        self.flushed = len(self)
+
+        if not self.nodes :
+            self.rebuild()
+            return
+
+        # Route each batch down to the child whose box is nearest, widening the boxes along the way
+        stack = [(0, idx)]
+        while stack :
+            node, idx = stack.pop()
+            pts = self.points[idx]
+
+            left, right, mins, maxs, leaf_idx, _ = self.nodes[node]
+            mins[:] = np.minimum(mins, pts.min(axis=0)).tolist()
+            maxs[:] = np.maximum(maxs, pts.max(axis=0)).tolist()
+
+            if left < 0 :
+                leaf_idx = np.concatenate([leaf_idx, idx])
+                if leaf_idx.shape[0] > 2 * self.leaf_size :
+                    self._build(leaf_idx, node)
+                else :
+                    self.nodes[node][4:] = [leaf_idx, self.points[leaf_idx]]
+                continue
+
+            near_left = _box_gap(pts, self.nodes[left]) <= _box_gap(pts, self.nodes[right])
+            if near_left.any() :
+                stack.append((left, idx[near_left]))
+            if not near_left.all() :
+                stack.append((right, idx[~near_left]))
+
+    def query(self, qs, k: int = 1) :
+        '''
+        Finds the k nearest indexed quaternions to each query by geodesic angle.
+
+        Args
+        ---
+        qs : quat, quat_array, list[quat] or array_like
+            A single unit quaternion, or (M, 4) unit quaternions to query at once
+        k : int, opt.
+            Number of neighbours to find
+
+        Returns
+        ---
+        angles : ndarray
+            (k,) or (M, k) rotation angles in radians to the neighbours, nearest first
+        indices : ndarray
+            (k,) or (M, k) indices of the neighbours, in the order they were inserted
+        '''
+        if not 1 <= k <= len(self) :
+            raise ValueError(f'Expected k between 1 and {len(self)}, got {k}')
+
+        queries, single = _queries(qs)
+        pending = np.arange(self.flushed, len(self))
+
+        angles = np.empty((queries.shape[0], k))
+        indices = np.empty((queries.shape[0], k), dtype=np.intp)
+        for row, x, extra in self._rows(queries) :
+            dist, idx = self._knn(x, k)
+            if extra is not None :
+                dist, idx = _smallest(np.concatenate([dist, extra]), np.concatenate([idx, pending]), k)
+
+            order = np.argsort(dist, kind='stable')
+            angles[row], indices[row] = _angle(dist[order]), idx[order]
+
+        return (angles[0], indices[0]) if single else (angles, indices)
+
+    def query_radius(self, qs, angle: float) :
+        '''
+        Finds every indexed quaternion within a geodesic angle of each query.
+
+        Args
+        ---
+        qs : quat, quat_array, list[quat] or array_like
+            A single unit quaternion, or (M, 4) unit quaternions to query at once
+        angle : float
+            Maximum rotation angle in radians between the query and its neighbours
+
+        Returns
+        ---
+        angles : ndarray or list[ndarray]
+            Rotation angles to the neighbours of the query, nearest first, or a list of them for each query
+        indices : ndarray or list[ndarray]
+            Indices of the neighbours of the query, or a list of them for each query
+        '''
+        radius = 2 * math.sin(min(max(angle, 0), math.pi) / 4)
+        queries, single = _queries(qs)
+        pending = np.arange(self.flushed, len(self))
+
+        angles, indices = [], []
+        for _, x, extra in self._rows(queries) :
+            dist, idx = self._within(x, radius)
+            if extra is not None :
+                near = extra <= radius
+                dist = np.concatenate([dist, extra[near]])
+                idx = np.concatenate([idx, pending[near]])
+
+            order = np.argsort(dist, kind='stable')
+            angles.append(_angle(dist[order]))
+            indices.append(idx[order])
+
+        return (angles[0], indices[0]) if single else (angles, indices)
+
+    def _knn(self, x, k: int) :
+        '''Best first search of the tree for the k nearest quaternions to x, returning their chordal distances and indices.'''
+        best_d, best_i = np.empty(0), np.empty(0, dtype=np.intp)
+        if not self.nodes :
+            return best_d, best_i
+
+        point = x.tolist()
+        bound = math.inf
+        heap = [(0.0, 0)]
+
+        while heap :
+            lower, node = heapq.heappop(heap)
+            if lower > bound :
+                break
+
+            left, right, _, _, idx, pts = self.nodes[node]
+            if left < 0 :
+                dist = _chordal(pts, x)
+                best_d, best_i = _smallest(np.concatenate([best_d, dist]), np.concatenate([best_i, idx]), k)
+                if best_d.shape[0] == k :
+                    bound = best_d.max()
+                continue
+
+            for child in (left, right) :
+                child_lower = self._lower(child, point)
+                if child_lower <= bound :
+                    heapq.heappush(heap, (child_lower, child))
+
+        return best_d, best_i
+
+    def _within(self, x, radius: float) :
+        '''Searches the tree for the quaternions within a chordal distance of x, returning their distances and indices.'''
+        dists, idxs = [np.empty(0)], [np.empty(0, dtype=np.intp)]
+        if not self.nodes :
+            return dists[0], idxs[0]
+
+        point = x.tolist()
+        stack = [0]
+        while stack :
+            node = stack.pop()
+            if self._lower(node, point) > radius :
+                continue
+
+            left, right, _, _, idx, pts = self.nodes[node]
+            if left < 0 :
+                dist = _chordal(pts, x)
+                near = dist <= radius
+                dists.append(dist[near])
+                idxs.append(idx[near])
+            else :
+                stack.extend((left, right))
+
+        return np.concatenate(dists), np.concatenate(idxs)
+
+    def _lower(self, node: int, point: list[float]) :
+        '''Returns a lower bound on the chordal distance from point, or its negation, to the quaternions under a node.'''
+        _, _, mins, maxs, _, _ = self.nodes[node]
+
+        pos = neg = 0.0
+        for lo, hi, p in zip(mins, maxs, point) :
+            gap = lo - p if p < lo else p - hi if p > hi else 0.0
+            pos += gap * gap
+            gap = lo + p if -p < lo else -p - hi if -p > hi else 0.0
+            neg += gap * gap
+
+        return math.sqrt(min(pos, neg))
+
+    def _rows(self, queries) :
+        '''Yields each query row with its (P,) chordal distances to the pending quaternions, or None if there are none, computed a block of rows at a time.'''
+        pending = self.points[self.flushed:]
+        for start in range(0, queries.shape[0], _ROWS) :
+            block = queries[start:start + _ROWS]
+            extra = np.sqrt(np.maximum(2 - 2 * np.abs(block @ pending.T), 0)) if pending.shape[0] else [None] * block.shape[0]
+            yield from zip(range(start, start + block.shape[0]), block, extra)
+
+def _box_gap(pts, node) :
+    '''Returns the squared distance from each (N, 4) point to the box of a node.'''
+    _, _, mins, maxs, _, _ = node
+    gap = np.maximum(mins - pts, 0) + np.maximum(pts - maxs, 0)
+    return np.einsum('ij,ij->i', gap, gap)
+
+def _queries(qs) :
+    '''Returns the (M, 4) query quaternions and whether a single quaternion was given.'''
+    # A quat_array or list of quats is a batch even when it holds one quaternion, only a quat or a (4,) array is a single query
+    if isinstance(qs, quat_array) or (isinstance(qs, list) and len(qs) > 0 and isinstance(qs[0], quat)) :
+        single = False
+    else :
+        single = isinstance(qs, quat) or np.ndim(qs) == 1
+    return quat_array(qs, copy=False).q, single
+
+def _chordal(points, x) :
+    '''Returns the chordal distance min(|p - x|, |p + x|) from x to each unit quaternion p.'''
+    return np.sqrt(np.maximum(2 - 2 * np.abs(points @ x), 0))
+
+def _angle(dist) :
+    '''Converts chordal distances 2 sin(theta / 4) to rotation angles theta.'''
+    return 4 * np.arcsin(np.minimum(dist / 2, 1))
+
+def _smallest(dist, idx, k: int) :
+    '''Returns the k smallest distances and their indices, unordered.'''
+    if dist.shape[0] <= k :
+        return dist, idx
+
+    keep = np.argpartition(dist, k - 1)[:k]
+    return dist[keep], idx[keep]
@@ -0,0 +1,378 @@
+from __future__ import annotations
+from .quat import quat
+from .quat_array import quat_array
+from .dual_quat import dual_quat
+from .dual_quat_array import dual_quat_array
+
+import numpy as np
+
+TYPE_CHECKING = False
+if TYPE_CHECKING :
+    from mpl_toolkits.mplot3d.axes3d import Axes3D
+
+# Colour of the arrow along each local axis
+COLORS = {'facing': ('black',), 'basis': ('red', 'green', 'blue')}
+
+def __getattr__(name: str) :
+    # matplotlib is only imported, and Axes3D.arrow3D registered, once the arrow patch is first asked for
+    if name == 'Arrow3D' :
+        from .arrow3d import Arrow3D
+        return Arrow3D
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+def plot_quat(ax: Axes3D, q: quat, arrows: str, len: float = 0.5) :
+    '''
+    Plot a unit quaternion representing a rotation as an arrow.
+    
+    Args
+    ---
+    ax : axes3d
+        The axis object to plot the arrows on
+    q : quat
+        The quaternion to plot
+    arrows : str
+        The arrows to show from ['facing', 'basis']
+        facing gives a single arrow in the x direction, basis gives three arrows in the x, y, z directions
+    len : float, opt.
+        The length of the arrows
+    '''
+    plot_arrows(ax, q, [0, 0, 0], arrows, len)
+
+def plot_quats(ax: Axes3D, qs, arrows: str, len: float = 0.5, max_arrows: int = 1000) :
+    '''
+    Plot multiple unit quaternions representing rotations as arrows.
+
+    All of the arrows of each colour are drawn with a single quiver call.
+    
+    Args
+    ---
+    ax : axes3d
+        The axis object to plot the arrows on
+    qs : list[quat] or quat_array
+        The quaternions to plot
+    arrows : str
+        The arrows to show from ['facing', 'basis']
+        facing gives a single arrow in the x direction, basis gives three arrows in the x, y, z directions
+    len : float, opt.
+        The length of the arrows
+    max_arrows : int, opt.
+        Maximum number of quaternions to draw, longer sequences are evenly decimated, None draws every quaternion
+
+    Returns
+    ---
+    quivers : list
+        The quiver collection of each colour
+    '''
+    rot = quat_array(qs, copy=False)
+    return plot_arrows_many(ax, rot, np.zeros((rot.q.shape[0], 3)), arrows, len, max_arrows)
+
+def plot_dual_quat(ax: Axes3D, dq: dual_quat, arrows: str, len: float = 0.5) :
+    '''
+    Plot a unit dual quaternion representing a 3D transform as an arrow.
+    
+    Args
+    ---
+    ax : axes3d
+        The axis object to plot the arrows on
+    dq : dual_quat
+        The dual quaternion to plot
+    arrows : str
+        The arrows to show from ['facing', 'basis']
+        facing gives a single arrow in the x direction, basis gives three arrows in the x, y, z directions
+    len : float, opt.
+        The length of the arrows
+    '''
+    trans, rot = dq.as_trans()
+    plot_arrows(ax, rot, trans, arrows, len)
+
+def plot_dual_quats(ax: Axes3D, dqs, arrows: str, len: float = 0.5, max_arrows: int = 1000) :
+    '''
+    Plot multiple unit dual quaternions representing 3D transforms as arrows.
+
+    All of the arrows of each colour are drawn with a single quiver call.
+    
+    Args
+    ---
+    ax : axes3d
+        The axis object to plot the arrows on
+    dqs : list[dual_quat] or dual_quat_array
+        The dual quaternions to plot
+    arrows : str
+        The arrows to show from ['facing', 'basis']
+        facing gives a single arrow in the x direction, basis gives three arrows in the x, y, z directions
+    len : float, opt.
+        The length of the arrows
+    max_arrows : int, opt.
+        Maximum number of dual quaternions to draw, longer sequences are evenly decimated, None draws every dual quaternion
+
+    Returns
+    ---
+    quivers : list
+        The quiver collection of each colour
+    '''
+    trans, rot = dual_quat_array(dqs, copy=False).as_trans()
+    return plot_arrows_many(ax, rot, trans, arrows, len, max_arrows)
+
+def plot_arrows_many(ax: Axes3D, rot: quat_array, positions, arrows: str, len: float = 0.5, max_arrows: int = 1000) :
+    '''
+    Plots the arrows of many orientations onto the given axis object, with one quiver call per colour.
+
+    Args
+    ---
+    ax : axes3d
+        The axis object to plot the arrows on
+    rot : quat_array
+        The orientation of each set of arrows
+    positions : array_like
+        (N, 3) x, y, z positions for the base of each set of arrows
+    arrows : str
+        The arrows to show from ['facing', 'basis']
+        facing gives a single arrow in the x direction, basis gives three arrows in the x, y, z directions
+    len : float, opt.
+        The length of the arrows
+    max_arrows : int, opt.
+        Maximum number of orientations to draw, longer sequences are evenly decimated keeping the first and last, None draws every orientation
+
+    Returns
+    ---
+    quivers : list
+        The quiver collection of each colour
+    '''
+    if arrows not in COLORS :
+        return []
+
+    positions = np.asarray(positions, dtype=np.float64)
+    count = positions.shape[0]
+    if max_arrows is not None and count > max_arrows :
+        keep = np.unique(np.linspace(0, count - 1, max_arrows).round().astype(int))
+        rot, positions = rot[keep], positions[keep]
+
+    # The columns of each rotation matrix are the rotated x, y, z axes
+    mats = rot.as_matrix()
+
+    quivers = []
+    for axis, color in enumerate(COLORS[arrows]) :
+        quivers.append(ax.quiver(*positions.T, *mats[:, :, axis].T, length=len, normalize=True, color=color))
+
+    return quivers
+
+def animate_quats(fig, ax: Axes3D, qs, arrows: str = 'basis', len: float = 0.5, interval: float = 33, count: int = None, path: str = None, fps: int = 30, writer = None) :
+    '''
+    Animate a sequence of unit quaternions representing rotations as arrows, one per frame.
+
+    The arrows are updated in place each frame with blitting, so the cost of a frame does not grow with the length of the sequence.
+
+    Args
+    ---
+    fig : figure
+        The figure containing the axis
+    ax : axes3d
+        The axis object to plot the arrows on, its limits are not changed during the animation
+    qs : quat_array or iterable of quat or quat_array
+        The quaternions to animate, iterators such as from pipeline.expand are consumed lazily
+    arrows : str, opt.
+        The arrows to show from ['facing', 'basis']
+    len : float, opt.
+        The length of the arrows
+    interval : float, opt.
+        Delay between frames in milliseconds
+    count : int, opt.
+        Number of frames to save, by default the length of qs if it has one
+    path : str, opt.
+        Video file to save the animation to, with one of matplotlib's writers
+    fps : int, opt.
+        Frame rate of the saved video
+    writer : str or matplotlib.animation.MovieWriter, opt.
+        The writer to save with, by default chosen by matplotlib from the file extension
+
+    Returns
+    ---
+    anim : FuncAnimation
+        Keep a reference to the animation while it plays
+    '''
+    return _animate(fig, ax, _frames(qs, quat_array), arrows, len, False, interval, _count(qs, count), path, fps, writer)
+
+def animate_dual_quats(fig, ax: Axes3D, dqs, arrows: str = 'basis', len: float = 0.5, trail: bool = True, interval: float = 33, count: int = None, path: str = None, fps: int = 30, writer = None) :
+    '''
+    Animate a sequence of unit dual quaternions representing 3D transforms as arrows, building up a trail of the positions visited.
+
+    The arrows and trail are updated in place each frame with blitting, so the cost of a frame does not grow with the length of the trajectory beyond drawing the trail.
+
+    Args
+    ---
+    fig : figure
+        The figure containing the axis
+    ax : axes3d
+        The axis object to plot the arrows on, its limits are not changed during the animation
+    dqs : dual_quat_array or iterable of dual_quat or dual_quat_array
+        The dual quaternions to animate, iterators such as from pipeline.expand or expand_chunks are consumed lazily
+    arrows : str, opt.
+        The arrows to show from ['facing', 'basis']
+    len : float, opt.
+        The length of the arrows
+    trail : bool, opt.
+        Whether to show the positions of the previous frames
+    interval : float, opt.
+        Delay between frames in milliseconds
+    count : int, opt.
+        Number of frames to save, by default the length of dqs if it has one
+    path : str, opt.
+        Video file to save the animation to, with one of matplotlib's writers
+    fps : int, opt.
+        Frame rate of the saved video
+    writer : str or matplotlib.animation.MovieWriter, opt.
+        The writer to save with, by default chosen by matplotlib from the file extension
+
+    Returns
+    ---
+    anim : FuncAnimation
+        Keep a reference to the animation while it plays
+    '''
+    return _animate(fig, ax, _frames(dqs, dual_quat_array), arrows, len, trail, interval, _count(dqs, count), path, fps, writer)
+
+def _animate(fig, ax: Axes3D, frames, arrows: str, len: float, trail: bool, interval: float, count: int, path: str, fps: int, writer) :
+    '''Creates the animation of (position, rotation matrix) frames, updating a fixed set of artists in place.'''
+    if arrows not in COLORS :
+        raise ValueError(f'Unknown arrows {arrows}, expected one of {list(COLORS)}')
+
+    from matplotlib.animation import FuncAnimation
+    from mpl_toolkits.mplot3d.art3d import Line3DCollection
+
+    collections = [Line3DCollection([], colors=color) for color in COLORS[arrows]]
+    for collection in collections :
+        # Empty collections cannot be autoscaled on matplotlib 3.9+, which also keeps the axis limits fixed as documented
+        try :
+            ax.add_collection3d(collection, autolim=False)
+        except TypeError :
+            # Before 3.9 there is no autolim and collections never rescale the axis
+            ax.add_collection3d(collection)
+    artists = list(collections)
+
+    # The trail is kept in a buffer which doubles when full, so appending a position is amortized constant time
+    if trail :
+        scatter = ax.scatter([], [], [], s=4, color='grey')
+        artists.append(scatter)
+        history = np.empty((1024, 3))
+        visited = 0
+
+    def update(frame) :
+        nonlocal history, visited
+
+        position, mat = frame
+        for axis, collection in enumerate(collections) :
+            collection.set_segments(_arrow_segments(position, mat, axis, len))
+
+        if trail :
+            if visited == history.shape[0] :
+                history = np.concatenate([history, np.empty_like(history)])
+            history[visited] = position
+            visited += 1
+            scatter.set_offsets(history[:visited, :2])
+            scatter.set_3d_properties(history[:visited, 2], 'z')
+
+        # Blitting draws the artists without the axis, which is where 3D artists are normally projected, so project them here
+        if getattr(ax, 'M', None) is not None :
+            for artist in artists :
+                artist.do_3d_projection()
+
+        return artists
+
+    anim = FuncAnimation(fig, update, frames=frames, init_func=lambda : artists, interval=interval, blit=True, cache_frame_data=False, save_count=count)
+    if path is not None :
+        anim.save(path, writer=writer, fps=fps)
+
+    return anim
+
+def _frames(poses, kind) :
+    '''Yields the position and rotation matrix of each pose, converting batches of poses in a single pass.'''
+    if isinstance(poses, (quat, dual_quat, quat_array, dual_quat_array)) :
+        poses = [poses]
+
+    for batch in poses :
+        batch = kind(batch)
+        if kind is dual_quat_array :
+            positions, rot = batch.as_trans()
+        else :
+            positions, rot = np.zeros((batch.q.shape[0], 3)), batch
+
+        yield from zip(positions, rot.as_matrix())
+
+def _count(poses, count: int) :
+    '''Returns the number of frames to save, from the poses if they have a length.'''
+    if count is None and isinstance(poses, (quat_array, dual_quat_array, list, tuple)) :
+        return len(poses)
+    return count
+
+def _arrow_segments(position, mat, axis: int, len: float) :
+    '''Returns the shaft and head line segments of an arrow along a column of a rotation matrix.'''
+    direction, side = mat[:, axis], mat[:, (axis + 1) % 3]
+    tip = position + len * direction
+    back = tip - 0.3 * len * direction
+
+    return [(position, tip), (tip, back + 0.15 * len * side), (tip, back - 0.15 * len * side)]
+
+def plot_arrows(ax: Axes3D, rot: quat, position: list[float], arrows: str, len: float = 0.5) :
+    '''
+    Plots arrows onto the given axis object.
+
+    Args
+    ---
+    ax : axes3d
+        The axis object to plot the arrows on
+    rot : quat
+        The orientation of the arrow
+    position: list[float]
+        The x, y, z position for the base of the arrow
+    arrows : str
+        The arrows to show from ['facing', 'basis']
+        facing gives a single arrow in the x direction, basis gives three arrows in the x, y, z directions
+    len : float, opt.
+        The length of the arrow
+    '''
+    if arrows == 'facing' :
+        dir_x = rot.rot_apply([len, 0, 0])
+        ax.quiver(*position, *dir_x, length=len, normalize=True, color='black')
+
+    elif arrows == 'basis' :
+        dir_x = rot.rot_apply([len, 0, 0])
+        dir_y = rot.rot_apply([0, len, 0])
+        dir_z = rot.rot_apply([0, 0, len])
+
+        ax.quiver(*position, *dir_x, length=len, normalize=True, color='red')
+        ax.quiver(*position, *dir_y, length=len, normalize=True, color='green')
+        ax.quiver(*position, *dir_z, length=len, normalize=True, color='blue')
+
+    
+    # if arrows == 'facing' :
+    #     dir_x = rot.rot_apply([len, 0, 0])
+    #     ax.arrow3D(*position,
+    #             *dir_x,
+    #             mutation_scale = 10,
+    #             arrowstyle = "-|>",
+    #             linestyle = 'solid')
+
+    # elif arrows == 'basis' :
+    #     dir_x = rot.rot_apply([len, 0, 0])
+    #     ax.arrow3D(*position,
+    #             *dir_x,
+    #             mutation_scale = 10,
+    #             arrowstyle = "-|>",
+    #             linestyle = 'solid',
+    #             color = 'red')
+        
+    #     dir_y = rot.rot_apply([0, len, 0])
+    #     ax.arrow3D(*position,
+    #             *dir_y,
+    #             mutation_scale = 10,
+    #             arrowstyle = "-|>",
+    #             linestyle = 'solid',
+    #             color = 'green')
+        
+    #     dir_z = rot.rot_apply([0, 0, len])
+    #     ax.arrow3D(*position,
+    #             *dir_z,
+    #             mutation_scale=10,
+    #             arrowstyle = "-|>",
+    #             linestyle = 'solid',
+    #             color = 'blue')
\ No newline at end of file
@@ -0,0 +1,91 @@
+from .quat_array import quat_array, qmul
+from .dual_quat_array import dual_quat_array, dqmul
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+def cumulative_compose(poses, workers: int = 1, executor = None) :
+    '''
+    Cumulative product of a sequence of quaternions or dual quaternions, out[i] = poses[0] * poses[1] * ... * poses[i].
+
+    Multiplication is associative, so the sequence is split into blocks which are scanned independently, then each block is left multiplied by the total of the blocks before it.
+    Within a block the scan is vectorized, so the Python loop only runs over about sqrt(N) steps.
+
+    Args
+    ---
+    poses : quat_array, dual_quat_array or array_like
+        (N, 4) quaternions or (N, 8) dual quaternions, real part first, to compose in order
+    workers : int, opt.
+        Number of blocks to scan in parallel, a thread pool of this size is used unless an executor is given
+    executor : concurrent.futures.Executor, opt.
+        Executor to scan the blocks with, such as a ProcessPoolExecutor
+
+    Returns
+    ---
+    out : quat_array, dual_quat_array or ndarray
+        (N, 4) or (N, 8) cumulative products, of the same type as poses
+    '''
+    kind = type(poses) if isinstance(poses, (quat_array, dual_quat_array)) else None
+    rows = poses.dq if isinstance(poses, dual_quat_array) else poses.q if isinstance(poses, quat_array) else np.asarray(poses, dtype=np.float64)
+
+    if rows.ndim != 2 or rows.shape[1] not in (4, 8) :
+        raise ValueError(f'Expected (N, 4) quaternions or (N, 8) dual quaternions, got shape {rows.shape}')
+    elif workers < 1 :
+        raise ValueError(f'The number of workers {workers} must be at least 1')
+
+    blocks = np.array_split(rows, min(workers, max(rows.shape[0], 1)))
+
+    if rows.shape[0] <= 1 or (executor is None and workers == 1) :
+        out = _scan(rows)
+    elif executor is None :
+        with ThreadPoolExecutor(workers) as pool :
+            out = _compose_blocks(blocks, pool)
+    else :
+        out = _compose_blocks(blocks, executor)
+
+    return out if kind is None else kind(out)
+
+def _compose_blocks(blocks: list, executor) :
+    '''Scans each block on the executor, then carries the running total across the blocks.'''
+    scanned = list(executor.map(_scan, blocks))
+
+    # The blocks are few, so their totals are scanned serially
+    totals = _scan(np.array([block[-1] for block in scanned]))
+    carried = executor.map(_carry, totals[:-1], scanned[1:])
+
+    return np.concatenate([scanned[0], *carried])
+
+def _scan(rows) :
+    '''
+    Cumulative product of (N, 4) or (N, 8) rows.
+
+    The rows are laid out as an (M, C) grid with C about sqrt(N), each grid row is scanned along its columns in a single vectorized pass, then the grid rows are carried by the scanned totals of the rows before them.
+    '''
+    count, width = rows.shape
+    mul = qmul if width == 4 else dqmul
+    if count <= 1 :
+        return rows.copy()
+
+    cols = int(np.ceil(np.sqrt(count)))
+    grid_rows = -(-count // cols)
+
+    # Pad with the identity, which only follows the real rows so leaves their products unchanged
+    grid = np.zeros((grid_rows * cols, width))
+    grid[:, 0] = 1
+    grid[:count] = rows
+
+    # Lay the columns out contiguously so each step of the scan reads and writes whole blocks of memory
+    grid = np.ascontiguousarray(grid.reshape(grid_rows, cols, width).transpose(1, 0, 2))
+
+    for j in range(1, cols) :
+        mul(grid[j - 1], grid[j], grid[j])
+
+    if grid_rows > 1 :
+        totals = _scan(grid[-1])
+        mul(totals[:-1], grid[:, 1:], grid[:, 1:])
+
+    return grid.transpose(1, 0, 2).reshape(-1, width)[:count]
+
+def _carry(total, block) :
+    '''Left multiplies every row of a scanned block by the total of the blocks before it.'''
+    mul = qmul if block.shape[-1] == 4 else dqmul
+    return mul(total, block, block)
@@ -0,0 +1,142 @@
+from .dual_quat_array import dual_quat_array
+from . import validation
+import numpy as np
+
+class skinner() :
+    def __init__(self, rest, indices, weights) :
+        '''
+        Deforms a mesh by Dual quaternion Linear Blending (DLB) of its bone transforms.
+
+        Each vertex blends the dual quaternions of the bones influencing it, the blend is normalized and applied to the rest pose of the vertex.
+        The working buffers are allocated once here and reused by every call to deform.
+
+        Kavan, Collins, Žára and O'Sullivan, 2008, Geometric skinning with approximate dual quaternion blending (https://doi.org/10.1145/1409625.1409627)
+
+        Args
+        ---
+        rest : array_like
+            (N, 3) vertices of the mesh in the rest pose
+        indices : array_like
+            (N, M) indices of the bones influencing each vertex
+        weights : array_like
+            (N, M) weight of each influence, unused influences have a weight of 0, each row is normalized to sum to 1
+            Vertices whose weights are all 0 stay at their rest pose
+        '''
+        self.rest = np.array(rest, dtype=np.float64)
+        indices = np.asarray(indices, dtype=np.intp)
+        weights = np.asarray(weights, dtype=np.float64)
+
+        if self.rest.ndim != 2 or self.rest.shape[1] != 3 :
+            raise ValueError(f'Expected (N, 3) rest vertices, got shape {self.rest.shape}')
+        elif indices.ndim != 2 or indices.shape[0] != self.rest.shape[0] or weights.shape != indices.shape :
+            raise ValueError(f'Expected (N, M) bone indices and weights for {self.rest.shape[0]} vertices, got shapes {indices.shape} and {weights.shape}')
+        elif np.any(weights < 0) :
+            raise ValueError('Bone weights must not be negative')
+        elif np.any(indices < 0) :
+            raise ValueError('Bone indices must not be negative')
+
+        # Order the influences by weight, so the antipodality of each vertex is corrected against its dominant bone
+        order = np.argsort(-weights, axis=1, kind='stable')
+        self.indices = np.take_along_axis(indices, order, axis=1)
+        self.weights = np.take_along_axis(weights, order, axis=1)
+
+        total = self.weights.sum(axis=1, keepdims=True)
+        self.weights /= np.where(total > 0, total, 1)
+
+        self.bone_count = int(self.indices.max()) + 1 if self.indices.size else 0
+
+        count, influences = self.indices.shape
+        self.gathered = np.empty((count, influences, 8))
+        self.signed = np.empty((count, influences))
+        self.blended = np.empty((count, 8))
+        self.scale = np.empty(count)
+        self.tmp = np.empty(count)
+        self.a = np.empty((count, 3))
+        self.b = np.empty((count, 3))
+        self.c = np.empty((count, 3))
+
+    def blend(self, bones, check: bool = None) :
+        '''
+        Blends the bone dual quaternions influencing each vertex, without normalizing.
+
+        Args
+        ---
+        bones : dual_quat_array, list[dual_quat] or array_like
+            (K, 8) unit dual quaternions taking each bone from the rest pose to the current pose
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        blended : ndarray
+            (N, 8) blended dual quaternions of each vertex, a view of a buffer which is overwritten by the next call
+        '''
+        bones = dual_quat_array(bones, copy=False)
+        if len(bones) < self.bone_count :
+            raise ValueError(f'Expected at least {self.bone_count} bones, got {len(bones)}')
+        elif validation.should_check(check) and not np.all(bones.is_unit()) :
+            raise BaseException('Only unit dual quaternions are valid representations of 3D transforms')
+
+        np.take(bones.dq, self.indices, axis=0, out=self.gathered)
+
+        # Flip the influences in the opposite hemisphere to the dominant bone so the blend takes the short path
+        np.einsum('nmi,ni->nm', self.gathered[..., :4], self.gathered[:, 0, :4], out=self.signed)
+        np.copysign(self.weights, self.signed, out=self.signed)
+
+        return np.einsum('nm,nmi->ni', self.signed, self.gathered, out=self.blended)
+
+    def deform(self, bones, out = None, check: bool = None) :
+        '''
+        Deforms the rest vertices by the bone transforms.
+
+        Args
+        ---
+        bones : dual_quat_array, list[dual_quat] or array_like
+            (K, 8) unit dual quaternions taking each bone from the rest pose to the current pose
+        out : ndarray, opt.
+            (N, 3) float64 array to write the deformed vertices into, reuse it between frames to avoid allocating
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+
+        Returns
+        ---
+        vertices : ndarray
+            (N, 3) deformed vertices
+        '''
+        blended = self.blend(bones, check)
+        if out is None :
+            out = np.empty_like(self.rest)
+
+        rest, a, b, c, tmp = self.rest, self.a, self.b, self.c, self.tmp
+        w, u = blended[:, 0, None], blended[:, 1:4]
+        dw, dv = blended[:, 4, None], blended[:, 5:]
+
+        # The blend is not normalized, so both terms are divided by its squared norm instead
+        # Vertices with no weight have a zero blend, their scale is left at 0 so they stay at the rest pose
+        np.einsum('ni,ni->n', blended[:, :4], blended[:, :4], out=self.scale)
+        np.divide(2, self.scale, out=self.scale, where=self.scale > 0)
+
+        # Rotation, v + 2 u x (u x v + w v) / |r|^2
+        _cross(u, rest, a, tmp)
+        np.multiply(rest, w, out=c)
+        a += c
+        _cross(u, a, b, tmp)
+
+        # Translation, 2 (w dv - dw u + u x dv) / |r|^2
+        _cross(u, dv, a, tmp)
+        np.multiply(dv, w, out=c)
+        a += c
+        np.multiply(u, dw, out=c)
+        a -= c
+
+        a += b
+        a *= self.scale[:, None]
+        return np.add(rest, a, out=out)
+
+def _cross(a, b, out, tmp) :
+    '''Cross products of (N, 3) arrays written into out, which must not overlap a or b, using tmp as (N,) scratch space.'''
+    for i in range(3) :
+        j, k = (i + 1) % 3, (i + 2) % 3
+        np.multiply(a[:, j], b[:, k], out=out[:, i])
+        np.multiply(a[:, k], b[:, j], out=tmp)
+        np.subtract(out[:, i], tmp, out=out[:, i])
@@ -0,0 +1,220 @@
+from .quat import quat
+from .quat_array import quat_array, qmul
+from .dual_quat import dual_quat
+from .dual_quat_array import dual_quat_array
+from . import validation
+import numpy as np
+
+class squad_spline() :
+    def __init__(self, keypoints, times = None, check: bool = None) :
+        '''
+        Spherical and Quadrangle (SQUAD) spline through a sequence of unit quaternions, with the control points precomputed.
+
+        Unlike piecewise SLERP the angular velocity is continuous through the keypoints.
+
+        Shoemake, 1987, Quaternion calculus and fast animation (SIGGRAPH course notes)
+
+        Args
+        ---
+        keypoints : list[quat], quat_array or array_like
+            (N, 4) unit quaternions to pass through, N must be at least 2
+        times : array_like, opt.
+            (N,) strictly increasing parameter of each keypoint, by default 0, 1, ..., N - 1
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+        '''
+        q = quat_array(keypoints).q
+        if q.shape[0] < 2 :
+            raise ValueError(f'A spline needs at least 2 keypoints, got {q.shape[0]}')
+        elif validation.should_check(check) and not np.all(quat_array(q, copy=False).is_unit()) :
+            raise BaseException('Only unit quaternions are valid representations of rotations')
+
+        self.times = _knots(times, q.shape[0])
+
+        # Keep neighbouring keypoints in the same hemisphere so each segment takes the short path
+        for i in range(1, q.shape[0]) :
+            if np.dot(q[i], q[i - 1]) < 0 :
+                q[i] = -q[i]
+        self.q = q
+
+        # s_i = q_i exp(-(h_i-1 log(q_i^-1 q_i+1) + h_i log(q_i^-1 q_i-1)) / (2 (h_i-1 + h_i))), with the endpoints as their own control points
+        # Weighting by the durations h of the neighbouring segments matches the angular velocity either side of the keypoint, for uniform times it is the usual / 4
+        h = np.diff(self.times)[:, None]
+        self.s = q.copy()
+        inv = q[1:-1] * [1, -1, -1, -1]
+        tangent = h[:-1] * quat_array(qmul(inv, q[2:]), copy=False).log().q + h[1:] * quat_array(qmul(inv, q[:-2]), copy=False).log().q
+        self.s[1:-1] = qmul(q[1:-1], quat_array(-tangent / (2 * (h[:-1] + h[1:])), copy=False).exp().q)
+
+    def __call__(self, t) :
+        '''
+        Evaluates the spline.
+
+        Args
+        ---
+        t : float or array_like
+            Parameter or parameters within the keypoint times to return values for
+
+        Returns
+        ---
+        q : quat or quat_array
+            A unit quaternion on the spline for a float t, otherwise a quat_array
+        '''
+        seg, h = _locate(self.times, t)
+
+        q = _slerp(_slerp(self.q[seg], self.q[seg + 1], h), _slerp(self.s[seg], self.s[seg + 1], h), 2 * h * (1 - h))
+
+        if np.ndim(t) == 0 :
+            return quat._new(*q.tolist())
+        return quat_array(q, copy=False)
+
+    def sample_n(self, n: int) :
+        '''
+        Returns n equally spaced samples of the spline, from the first keypoint to the last.
+
+        Args
+        ---
+        n : int
+            Number of samples to return
+
+        Returns
+        ---
+        qs : quat_array
+        '''
+        return self(np.linspace(self.times[0], self.times[-1], n))
+
+class dq_spline() :
+    def __init__(self, keypoints, times = None, check: bool = None) :
+        '''
+        Spline through a sequence of unit dual quaternions, with the control points and coefficients precomputed.
+
+        The rotation follows a SQUAD spline, so has a continuous angular velocity, and the translation follows a natural cubic spline, so is C2 continuous.
+
+        Args
+        ---
+        keypoints : list[dual_quat] or dual_quat_array
+            (N, 8) unit dual quaternions to pass through, N must be at least 2
+        times : array_like, opt.
+            (N,) strictly increasing parameter of each keypoint, by default 0, 1, ..., N - 1
+        check : bool, opt.
+            Whether to validate the inputs, by default the active validation policy decides
+        '''
+        keypoints = dual_quat_array(keypoints, copy=False)
+        if len(keypoints) < 2 :
+            raise ValueError(f'A spline needs at least 2 keypoints, got {len(keypoints)}')
+
+        vec, rot = keypoints.as_trans(check)
+
+        self.rot = squad_spline(rot, times, validation.nested_check(check))
+        self.times = self.rot.times
+        self.coefs = _cubic_coefs(self.times, vec)
+
+    def __call__(self, t) :
+        '''
+        Evaluates the spline.
+
+        Args
+        ---
+        t : float or array_like
+            Parameter or parameters within the keypoint times to return values for
+
+        Returns
+        ---
+        dq : dual_quat or dual_quat_array
+            A unit dual quaternion on the spline for a float t, otherwise a dual_quat_array
+        '''
+        seg, _ = _locate(self.times, t)
+
+        # Horner's method in the local parameter of each segment
+        u = (np.asarray(t, dtype=np.float64) - self.times[seg])[..., None]
+        c = self.coefs[seg]
+        vec = ((c[..., 3, :] * u + c[..., 2, :]) * u + c[..., 1, :]) * u + c[..., 0, :]
+
+        rot = self.rot(t)
+        if np.ndim(t) == 0 :
+            return dual_quat.from_trans(vec.tolist(), rot, False)
+        return dual_quat_array.from_trans(vec, rot, False)
+
+    def sample_n(self, n: int) :
+        '''
+        Returns n equally spaced samples of the spline, from the first keypoint to the last.
+
+        Args
+        ---
+        n : int
+            Number of samples to return
+
+        Returns
+        ---
+        dqs : dual_quat_array
+        '''
+        return self(np.linspace(self.times[0], self.times[-1], n))
+
+def _knots(times, count: int) :
+    '''Returns the validated (N,) parameters of the keypoints.'''
+    if times is None :
+        return np.arange(count, dtype=np.float64)
+
+    times = np.asarray(times, dtype=np.float64)
+    if times.shape != (count,) :
+        raise ValueError(f'Expected {count} keypoint times, got shape {times.shape}')
+    elif not np.all(np.diff(times) > 0) :
+        raise ValueError('Keypoint times must be strictly increasing')
+
+    return times
+
+def _locate(times, t) :
+    '''Returns the segment containing each parameter and how far along the segment it is.'''
+    t = np.asarray(t, dtype=np.float64)
+    if not np.all((t >= times[0]) & (t <= times[-1])) :
+        raise BaseException(f'The values of t {t} must be in [{times[0]},{times[-1]}]')
+
+    seg = np.clip(np.searchsorted(times, t, side='right') - 1, 0, times.shape[0] - 2)
+    h = (t - times[seg]) / (times[seg + 1] - times[seg])
+    return seg, h
+
+def _cubic_coefs(times, y) :
+    '''
+    Returns the (N - 1, 4, D) polynomial coefficients of the natural cubic spline through the (N, D) values y, in the local parameter of each segment.
+
+    The second derivatives at the knots are solved from their tridiagonal system with the Thomas algorithm.
+    '''
+    count = times.shape[0]
+    h = np.diff(times)
+    slope = np.diff(y, axis=0) / h[:, None]
+
+    m = np.zeros_like(y)
+    if count > 2 :
+        diag = 2 * (h[:-1] + h[1:])
+        rhs = 6 * (slope[1:] - slope[:-1])
+
+        # Forward sweep, then back substitution, with the natural end conditions m_0 = m_N-1 = 0
+        for i in range(1, count - 2) :
+            factor = h[i] / diag[i - 1]
+            diag[i] -= factor * h[i]
+            rhs[i] -= factor * rhs[i - 1]
+
+        m[-2] = rhs[-1] / diag[-1]
+        for i in range(count - 4, -1, -1) :
+            m[i + 1] = (rhs[i] - h[i + 1] * m[i + 2]) / diag[i]
+
+    coefs = np.empty((count - 1, 4, y.shape[1]))
+    coefs[:, 0] = y[:-1]
+    coefs[:, 1] = slope - h[:, None] * (2 * m[:-1] + m[1:]) / 6
+    coefs[:, 2] = m[:-1] / 2
+    coefs[:, 3] = (m[1:] - m[:-1]) / (6 * h[:, None])
+    return coefs
+
+def _slerp(a, b, tau) :
+    '''Batched SLERP between (..., 4) unit quaternions without the shortest path flip, as required by the SQUAD construction.'''
+    dot = np.clip(np.einsum('...i,...i->...', a, b), -1, 1)
+    theta = np.arccos(dot)
+    sin_theta = np.sin(theta)
+
+    # Fall back to linear weights where the endpoints coincide
+    close = sin_theta <= 1e-12
+    sin_theta = np.where(close, 1, sin_theta)
+    c_a = np.where(close, 1 - tau, np.sin((1 - tau) * theta) / sin_theta)
+    c_b = np.where(close, tau, np.sin(tau * theta) / sin_theta)
+
+    q = c_a[..., None] * a + c_b[..., None] * b
+    return q / np.linalg.norm(q, axis=-1, keepdims=True)
@@ -0,0 +1,161 @@
+from .dual_quat_array import dual_quat_array
+import numpy as np
+import shutil
+import struct
+import tempfile
+
+# File layout, all little endian:
+#   64 byte header: magic, version, flags, pose count
+#   count x 8 float64 dual quaternion rows, real part first
+#   count float64 timestamps, if the timestamp flag is set
+MAGIC = b'DQTRAJ\x00\x00'
+VERSION = 1
+HEADER = struct.Struct('<8sIIQ40x')
+HAS_TIMESTAMPS = 1
+
+DTYPE = np.dtype('<f8')
+
+def save(path, poses, timestamps = None) :
+    '''
+    Saves a trajectory of dual quaternions to a binary file.
+
+    Args
+    ---
+    path : str or path_like
+        The file to write
+    poses : dual_quat_array, list[dual_quat] or array_like
+        (N, 8) dual quaternions of the trajectory
+    timestamps : array_like, opt.
+        (N,) timestamps of each pose
+    '''
+    poses = dual_quat_array(poses, copy=False).dq
+    if timestamps is not None :
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        if timestamps.shape != (poses.shape[0],) :
+            raise ValueError(f'Expected {poses.shape[0]} timestamps, got shape {timestamps.shape}')
+
+    with open(path, 'wb') as file :
+        file.write(HEADER.pack(MAGIC, VERSION, 0 if timestamps is None else HAS_TIMESTAMPS, poses.shape[0]))
+        file.write(poses.astype(DTYPE, copy=False).tobytes())
+        if timestamps is not None :
+            file.write(timestamps.astype(DTYPE, copy=False).tobytes())
+
+def load(path, mmap: bool = False) :
+    '''
+    Loads a trajectory of dual quaternions from a binary file.
+
+    Args
+    ---
+    path : str or path_like
+        The file to read
+    mmap : bool, opt.
+        Whether to memory map the file instead of reading it, so slices of the trajectory are only read from disk when accessed
+
+    Returns
+    ---
+    poses : dual_quat_array
+        (N, 8) dual quaternions of the trajectory, backed directly by the file when memory mapped
+    timestamps : ndarray or None
+        (N,) timestamps of each pose if the file has them
+    '''
+    with open(path, 'rb') as file :
+        flags, count = _read_header(file)
+
+        # Empty files cannot be memory mapped
+        if not mmap or count == 0 :
+            poses = np.fromfile(file, dtype=DTYPE, count=count * 8)
+            timestamps = np.fromfile(file, dtype=DTYPE, count=count) if flags & HAS_TIMESTAMPS else None
+            if poses.shape[0] != count * 8 or (timestamps is not None and timestamps.shape[0] != count) :
+                raise ValueError('Trajectory file is truncated')
+
+            return dual_quat_array(poses.reshape(count, 8), copy=False), timestamps
+
+    poses = np.memmap(path, dtype=DTYPE, mode='r', offset=HEADER.size, shape=(count, 8))
+    timestamps = None
+    if flags & HAS_TIMESTAMPS :
+        timestamps = np.memmap(path, dtype=DTYPE, mode='r', offset=HEADER.size + poses.nbytes, shape=(count,))
+
+    return dual_quat_array(poses, copy=False), timestamps
+
+class trajectory_writer() :
+    def __init__(self, path, timestamps: bool = False) :
+        '''
+        Writes a trajectory of dual quaternions to a binary file incrementally, so the whole trajectory never needs to be in memory.
+
+        Use as a context manager, or call close when finished so the header is completed.
+
+        Args
+        ---
+        path : str or path_like
+            The file to write
+        timestamps : bool, opt.
+            Whether a timestamp is written with each pose
+        '''
+        self.file = open(path, 'wb')
+        self.count = 0
+        self.flags = HAS_TIMESTAMPS if timestamps else 0
+
+        # Timestamps follow all of the poses in the file, so hold them aside until closing
+        self.times = tempfile.TemporaryFile() if timestamps else None
+
+        self.file.write(HEADER.pack(MAGIC, VERSION, self.flags, 0))
+
+    def write(self, poses, timestamps = None) :
+        '''
+        Appends poses to the trajectory.
+
+        Args
+        ---
+        poses : dual_quat, dual_quat_array, list[dual_quat] or array_like
+            (N, 8) dual quaternions to append
+        timestamps : float or array_like, opt.
+            (N,) timestamps of each pose, required if the writer was created with timestamps
+        '''
+        poses = dual_quat_array(poses, copy=False).dq
+
+        if self.times is not None :
+            if timestamps is None :
+                raise ValueError('Timestamps are required for each pose')
+
+            timestamps = np.asarray(timestamps, dtype=np.float64).reshape(-1)
+            if timestamps.shape != (poses.shape[0],) :
+                raise ValueError(f'Expected {poses.shape[0]} timestamps, got shape {timestamps.shape}')
+
+            self.times.write(timestamps.astype(DTYPE, copy=False).tobytes())
+
+        self.file.write(poses.astype(DTYPE, copy=False).tobytes())
+        self.count += poses.shape[0]
+
+    def close(self) :
+        '''Writes the timestamps and the final header, then closes the file.'''
+        if self.file.closed :
+            return
+
+        if self.times is not None :
+            self.times.seek(0)
+            shutil.copyfileobj(self.times, self.file)
+            self.times.close()
+
+        self.file.seek(0)
+        self.file.write(HEADER.pack(MAGIC, VERSION, self.flags, self.count))
+        self.file.close()
+
+    def __enter__(self) :
+        return self
+
+    def __exit__(self, *args) :
+        self.close()
+
+def _read_header(file) :
+    '''Reads and validates a trajectory file header, returning the flags and pose count.'''
+    header = file.read(HEADER.size)
+    if len(header) != HEADER.size :
+        raise ValueError('File is too short to be a trajectory')
+
+    magic, version, flags, count = HEADER.unpack(header)
+    if magic != MAGIC :
+        raise ValueError('File is not a trajectory')
+    elif version != VERSION :
+        raise ValueError(f'Unsupported trajectory version {version}')
+
+    return flags, count
@@ -0,0 +1,81 @@
+# Validate every input, including inside nested operations (the default)
+STRICT = 'strict'
+# Validate inputs once where they enter the library, not inside nested operations
+BOUNDARY = 'boundary'
+# Trust all inputs and skip validation entirely
+OFF = 'off'
+
+POLICIES = (STRICT, BOUNDARY, OFF)
+
+_policy = STRICT
+
+def get_policy() :
+    '''Returns the active validation policy.'''
+    return _policy
+
+def set_policy(policy: str) :
+    '''
+    Sets the global validation policy used when no check is given to an operation.
+
+    Args
+    ---
+    policy : str
+        The policy from ['strict', 'boundary', 'off']
+        strict checks every input including inside nested operations, boundary checks inputs once at the outermost operation, off skips all checks
+    '''
+    global _policy
+
+    if policy not in POLICIES :
+        raise ValueError(f'Unknown validation policy {policy}, expected one of {POLICIES}')
+
+    _policy = policy
+
+class policy() :
+    def __init__(self, policy: str) :
+        '''
+        Context manager which sets the validation policy for the duration of the block.
+
+        A class rather than contextlib.contextmanager, which would add contextlib to the import time of quat.
+
+        Args
+        ---
+        policy : str
+            The policy from ['strict', 'boundary', 'off']
+        '''
+        if policy not in POLICIES :
+            raise ValueError(f'Unknown validation policy {policy}, expected one of {POLICIES}')
+
+        self.policy = policy
+
+    def __enter__(self) :
+        self.prev = _policy
+        set_policy(self.policy)
+
+    def __exit__(self, *exc) :
+        set_policy(self.prev)
+
+def should_check(check: bool = None) :
+    '''
+    Returns whether an operation should validate its inputs.
+
+    Args
+    ---
+    check : bool, opt.
+        The per call override, if None the active policy decides
+    '''
+    if check is None :
+        return _policy != OFF
+    return check
+
+def nested_check(check: bool = None) :
+    '''
+    Returns the check argument an operation should pass on to the operations it calls.
+
+    Args
+    ---
+    check : bool, opt.
+        The check argument the calling operation was given
+    '''
+    if check is False or _policy != STRICT :
+        return False
+    return None
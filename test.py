@@ -1,6 +1,6 @@
-from quat import quat as q
-from dual_quat import dual_quat as dq
-import quat_plot
+from quaternions.quat import quat as q
+from quaternions.dual_quat import dual_quat as dq
+from quaternions import quat_plot
 
 import matplotlib.pyplot as plt
 from matplotlib.patches import FancyArrowPatch